@@ -3,6 +3,10 @@
 This package contains the FastAPI app, agents, models, and Temporal orchestration.
 """
 
+import os
+import warnings
+from functools import cache
+
 import logfire
 
 from .config import (
@@ -13,10 +17,37 @@ from .config import (
 )
 
 
+@cache
 def setup_logfire() -> logfire.Logfire:
-    instance = logfire.configure(console=None)
+    """Configure Logfire and its instrumentation once per process and return the instance.
+
+    This runs on package import, so it reads its options straight from the process environment (like Logfire's own
+    `LOGFIRE_*` variables) instead of loading `Settings`, which must not happen at import time. They are therefore
+    not read from `.env`:
+
+    - `LOGFIRE_SAMPLE_RATE`: fraction of traces sent to Logfire (default: 1.0); an invalid value falls back to the
+      default with a warning rather than failing the import
+    - `LOGFIRE_CAPTURE_HTTP_BODIES`: set to "true" to capture full HTTP headers and bodies in Logfire spans
+      (default: false)
+    """
+    raw_sample_rate = os.getenv("LOGFIRE_SAMPLE_RATE", "1.0")
+    try:
+        sample_rate = float(raw_sample_rate)
+    except ValueError:
+        sample_rate = -1.0
+    if not 0.0 <= sample_rate <= 1.0:
+        warnings.warn(
+            f"LOGFIRE_SAMPLE_RATE must be a number between 0 and 1, got {raw_sample_rate!r}; using 1.0",
+            stacklevel=2,
+        )
+        sample_rate = 1.0
+    instance = logfire.configure(
+        console=None,
+        sampling=logfire.SamplingOptions(head=sample_rate),
+    )
     logfire.instrument_pydantic_ai()
-    logfire.instrument_httpx(capture_all=True)
+    # Capturing headers and bodies serializes every LLM and Jina payload, so only do it when debugging
+    logfire.instrument_httpx(capture_all=os.getenv("LOGFIRE_CAPTURE_HTTP_BODIES", "false").lower() == "true")
     return instance
 
 
@@ -1,5 +1,6 @@
 """Agents for the pydantic-temporal-example app."""
 
+from pydantic_temporal_example.agents.batch import run_batch_async
 from pydantic_temporal_example.agents.dispatch_agent import (
     DispatchResult,
     GitHubRequest,
@@ -18,4 +19,5 @@ __all__ = [
     "WebResearchRequest",
     "WorkflowRequest",
     "dispatch_agent",
+    "run_batch_async",
 ]
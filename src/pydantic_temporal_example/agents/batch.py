@@ -0,0 +1,46 @@
+"""Helpers for running an agent over many prompts concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import cast
+
+from pydantic_ai.agent import AbstractAgent, AgentRunResult
+
+
+async def run_batch_async[AgentDepsT, OutputDataT](
+    agent: AbstractAgent[AgentDepsT, OutputDataT],
+    prompts: Sequence[str],
+    *,
+    deps: AgentDepsT | None = None,
+    concurrency: int = 8,
+) -> list[AgentRunResult[OutputDataT]]:
+    """Run `agent` once per prompt, with at most `concurrency` runs in flight.
+
+    Sharing one (cached) agent across the batch lets the runs reuse its model client and connection pool.
+
+    Args:
+        agent: The agent to run.
+        prompts: The user prompts, one agent run each.
+        deps: Dependencies passed to every run.
+        concurrency: Maximum number of concurrent agent runs.
+
+    Returns:
+        The run results, in the same order as `prompts`.
+
+    Raises:
+        ValueError: If `concurrency` is less than 1.
+    """
+    if concurrency < 1:
+        msg = "concurrency must be at least 1"
+        raise ValueError(msg)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_one(prompt: str) -> AgentRunResult[OutputDataT]:
+        async with semaphore:
+            # `None` is what `agent.run` itself defaults `deps` to for agents without dependencies
+            return await agent.run(prompt, deps=cast("AgentDepsT", deps))
+
+    return await asyncio.gather(*(_run_one(prompt) for prompt in prompts))
@@ -5,17 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Literal
 
+# Imported for its side effect of registering the `claude-code:` model prefix used by GITHUB_AGENT_MODEL
+import pydantic_ai_claude_code  # noqa: F401  # pyright: ignore[reportUnusedImport]
 from pydantic import with_config
 from pydantic_ai import Agent, WebSearchUserLocation
 from pydantic_ai.common_tools.duckduckgo import duckduckgo_search_tool
-from pydantic_ai_claude_code import ClaudeCodeProvider
 
 from pydantic_temporal_example.config import get_github_agent_model
 
-provider = ClaudeCodeProvider({"use_sandbox_runtime": False})
 
-
-@dataclass
+@dataclass(slots=True)
 @with_config(use_attribute_docstrings=True)
 class NoResponse:
     """A marker that indicates that you do not currently need to reply to the thread.
@@ -29,7 +28,7 @@ class NoResponse:
     type: Literal["no-response"]
 
 
-@dataclass
+@dataclass(slots=True)
 @with_config(use_attribute_docstrings=True)
 class SlackResponse:
     """A marker that indicates that you want to immediately send a response message.
@@ -49,7 +48,7 @@ class SlackResponse:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 @with_config(use_attribute_docstrings=True)
 class WebResearchRequest:
     """A marker that indicates that you are ready to delegate to the web research agent.
@@ -68,7 +67,7 @@ class WebResearchRequest:
     """Full Slack thread context for agent reference"""
 
 
-@dataclass
+@dataclass(slots=True)
 @with_config(use_attribute_docstrings=True)
 class GitHubRequest:
     """A marker that indicates that you are ready to delegate to the github agent."""
@@ -80,7 +79,7 @@ class GitHubRequest:
     """Full Slack thread context for agent reference"""
 
 
-@dataclass
+@dataclass(slots=True)
 @with_config(use_attribute_docstrings=True)
 class WorkflowRequest:
     """Generic workflow request with agent routing and scheduling information.
@@ -103,6 +102,9 @@ class WorkflowRequest:
     agent_type: str
     """Type of agent: 'github', 'web_research', 'slack'"""
 
+    query: str
+    """The actual query/instruction for the agent"""
+
     agent_role: str = "default"
     """Role specialization:
     - **GitHub Agents:** 'implementer', 'reviewer', 'fixer', 'verifier', 'analyzer', 'documenter', 'default'
@@ -110,9 +112,6 @@ class WorkflowRequest:
     - **Slack:** 'default'
     """
 
-    query: str
-    """The actual query/instruction for the agent"""
-
     workflow_type: Literal["oneshot", "periodic"] = "oneshot"
     """Whether to run once or repeatedly"""
 
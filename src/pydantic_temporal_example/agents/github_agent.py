@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
 import logfire
-import uvloop
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.exceptions import AgentRunError, ApprovalRequired, CallDeferred, ModelRetry, UserError
 from pydantic_ai_claude_code import ClaudeCodeModel, ClaudeCodeProvider
 
 from pydantic_temporal_example.tools import GitHubConn
 
+if TYPE_CHECKING:
+    from github.PullRequest import PullRequest
+
 provider = ClaudeCodeProvider({"use_sandbox_runtime": False, "model": "opus", "fallback_model": "sonnet"})
 model_instance = ClaudeCodeModel("opus", provider=provider)
 
@@ -18,6 +24,8 @@ model_instance = ClaudeCodeModel("opus", provider=provider)
 class GitHubDependencies(BaseModel):
     """Dependencies for the GitHub agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     repo_name: str = Field(..., description="Repository name (without organization)")
     pr_number: int = Field(default=1, description="Pull request number")
     path: str = Field(default="", description="Path within the repository (default: root)")
@@ -26,9 +34,21 @@ class GitHubDependencies(BaseModel):
 class GitHubResponse(BaseModel):
     """Structured output produced by the GitHub agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     response: str = Field(description="The formatted message to show to the user.")
 
 
+@cache
+def _get_github_conn() -> GitHubConn:
+    """Return the GitHub connection shared by all tools.
+
+    PyGithub keeps a pooled HTTP session per client, so reusing one connection keeps connections to the GitHub API
+    alive between tool calls instead of re-establishing them for each call.
+    """
+    return GitHubConn()
+
+
 # Define tool functions first (before agent creation)
 async def view_repo_files(_ctx: RunContext[GitHubDependencies], repo_name: str, path: str) -> str:
     """View files in the repository at the specified path.
@@ -41,12 +61,10 @@ async def view_repo_files(_ctx: RunContext[GitHubDependencies], repo_name: str,
     Returns:
         Formatted string listing the files and directories
     """
-    github = GitHubConn()
+    github = _get_github_conn()
     files = github.get_repo_files(repo_name, path)
     result = [f"Files in {repo_name}/{path or 'root'}:"]
-    for file in files:
-        file_type = "📁" if file.type == "dir" else "📄"
-        result.append(f"{file_type} {file.path}")
+    result.extend(f"{'📁' if file.type == 'dir' else '📄'} {file.path}" for file in files)
     return "\n".join(result)
 
 
@@ -61,17 +79,8 @@ async def view_pull_request(_ctx: RunContext[GitHubDependencies], repo_name: str
     Returns:
         Formatted string with PR details
     """
-    github = GitHubConn()
-    pr = github.get_pull_request(repo_name, pr_number)
-    return (
-        f"Pull Request #{pr.number}: {pr.title}\n"
-        f"State: {pr.state}\n"
-        f"Author: {pr.user.login}\n"
-        f"Created: {pr.created_at}\n"
-        f"Description: {pr.body or 'No description'}\n"
-        f"Changed Files: {pr.changed_files}\n"
-        f"Additions: +{pr.additions} | Deletions: -{pr.deletions}"
-    )
+    github = _get_github_conn()
+    return _format_pull_request(github.get_pull_request(repo_name, pr_number))
 
 
 async def view_pr_comments(_ctx: RunContext[GitHubDependencies], repo_name: str, pr_number: int) -> str:
@@ -85,18 +94,54 @@ async def view_pr_comments(_ctx: RunContext[GitHubDependencies], repo_name: str,
     Returns:
         Formatted string with all comments
     """
-    github = GitHubConn()
-    comments = github.get_pr_comments(repo_name, pr_number)
+    github = _get_github_conn()
+    return _format_pr_comments(pr_number, github.get_pr_comments(repo_name, pr_number))
+
+
+async def view_pr_bundle(_ctx: RunContext[GitHubDependencies], repo_name: str, pr_number: int) -> str:
+    """View details and all comments of a pull request in one call.
+
+    Args:
+        _ctx: Runtime context with dependencies (unused)
+        repo_name: Repository name (without organization)
+        pr_number: Pull request number
+
+    Returns:
+        Formatted string with PR details followed by all comments
+    """
+    github = _get_github_conn()
+    # PyGithub is blocking, so run both lookups in threads to overlap the GitHub round trips
+    pr, comments = await asyncio.gather(
+        asyncio.to_thread(github.get_pull_request, repo_name, pr_number),
+        asyncio.to_thread(github.get_pr_comments, repo_name, pr_number),
+    )
+    return f"{_format_pull_request(pr)}\n\n{_format_pr_comments(pr_number, comments)}"
+
+
+def _format_pull_request(pr: PullRequest) -> str:
+    """Format pull request details for the agent."""
+    return (
+        f"Pull Request #{pr.number}: {pr.title}\n"
+        f"State: {pr.state}\n"
+        f"Author: {pr.user.login}\n"
+        f"Created: {pr.created_at}\n"
+        f"Description: {pr.body or 'No description'}\n"
+        f"Changed Files: {pr.changed_files}\n"
+        f"Additions: +{pr.additions} | Deletions: -{pr.deletions}"
+    )
+
+
+def _format_pr_comments(pr_number: int, comments: list[dict[str, Any]]) -> str:
+    """Format pull request comments for the agent."""
     if not comments:
         return f"No comments found on PR #{pr_number}"
 
     result = [f"Comments on PR #{pr_number}:"]
-    for comment in comments:
-        comment_type = "💬" if comment["type"] == "issue_comment" else "📝"
-        result.append(f"\n{comment_type} {comment['user']} ({comment['created_at']}):\n{comment['body']}")
-        if "path" in comment:
-            result.append(f"  File: {comment['path']}")
-
+    result.extend(
+        f"\n{'💬' if comment['type'] == 'issue_comment' else '📝'} {comment['user']} ({comment['created_at']}):"
+        f"\n{comment['body']}" + (f"\n  File: {comment['path']}" if "path" in comment else "")
+        for comment in comments
+    )
     return "\n".join(result)
 
 
@@ -110,14 +155,13 @@ async def view_branches(_ctx: RunContext[GitHubDependencies], repo_name: str) ->
     Returns:
         Formatted string listing all branches
     """
-    github = GitHubConn()
+    github = _get_github_conn()
     branches = github.get_branches(repo_name)
-    logfire.info(f"Branches in {repo_name}: {branches}")
+    logfire.info("Branches in {repo_name}", repo_name=repo_name, count=len(branches))
     result = [f"Branches in {repo_name}:"]
-    for branch in branches:
-        protected = "🔒" if branch["protected"] else "🔓"
-        result.append(f"{protected} {branch['name']} ({branch['sha'][:7]})")
-    logfire.info(f"Branches in {repo_name}: {result}")
+    result.extend(
+        f"{'🔒' if branch['protected'] else '🔓'} {branch['name']} ({branch['sha'][:7]})" for branch in branches
+    )
     return "\n".join(result)
 
 
@@ -132,7 +176,7 @@ async def list_all_pull_requests(_ctx: RunContext[GitHubDependencies], repo_name
     Returns:
         Formatted string listing all PRs
     """
-    github = GitHubConn()
+    github = _get_github_conn()
     prs = github.list_pull_requests(repo_name, state)
     if not prs:
         return f"No pull requests found in {repo_name}"
@@ -144,7 +188,7 @@ async def list_all_pull_requests(_ctx: RunContext[GitHubDependencies], repo_name
         f"\n  Created: {pr['created_at']}"
         for pr in prs
     )
-    logfire.info(f"Pull Requests in {repo_name}: {result}")
+    logfire.info("Pull Requests in {repo_name}", repo_name=repo_name, count=len(prs))
     return "\n".join(result)
 
 
@@ -160,40 +204,48 @@ async def get_current_repo(ctx: RunContext[GitHubDependencies]) -> str:
     return ctx.deps.repo_name
 
 
-# Create agent and register tools
-github_agent = Agent(
-    model=model_instance,
-    deps_type=GitHubDependencies,
-    output_type=GitHubResponse,
-    system_prompt=(
-        "You are a GitHub analysis agent that helps users understand "
-        "repositories, pull requests, and code structure. "
-        "Provide clear, informative responses based on the repository data. "
-        "IMPORTANT: Always use the get_current_repo tool to retrieve the repository name "
-        "instead of guessing or using placeholders like 'current'. "
-        "You should FOLLOW THE INSTRUCTIONS CAREFULLY, USE THE TOOLS AND THEN PROVIDE YOUR OUTPUT."
-    ),
-)
-
-# Register all tools
-github_agent.tool(get_current_repo)
-github_agent.tool(view_repo_files)
-github_agent.tool(view_pull_request)
-github_agent.tool(view_pr_comments)
-github_agent.tool(view_branches)
-github_agent.tool(list_all_pull_requests)
+@cache
+def get_github_agent() -> Agent[GitHubDependencies, GitHubResponse]:
+    """Build the GitHub agent and register its tools.
+
+    Cached so the agent (and its output schema) is only constructed once per process.
+    """
+    agent = Agent(
+        model=model_instance,
+        deps_type=GitHubDependencies,
+        output_type=GitHubResponse,
+        system_prompt=(
+            "You are a GitHub analysis agent that helps users understand "
+            "repositories, pull requests, and code structure. "
+            "Provide clear, informative responses based on the repository data. "
+            "IMPORTANT: Always use the get_current_repo tool to retrieve the repository name "
+            "instead of guessing or using placeholders like 'current'. "
+            "When you need both a pull request's details and its comments, use the view_pr_bundle tool. "
+            "You should FOLLOW THE INSTRUCTIONS CAREFULLY, USE THE TOOLS AND THEN PROVIDE YOUR OUTPUT."
+        ),
+    )
+
+    # Register all tools
+    agent.tool(get_current_repo)
+    agent.tool(view_repo_files)
+    agent.tool(view_pull_request)
+    agent.tool(view_pr_comments)
+    agent.tool(view_pr_bundle)
+    agent.tool(view_branches)
+    agent.tool(list_all_pull_requests)
+    return agent
 
 
 if __name__ == "__main__":
     # Example usage (requires GITHUB_PAT and GITHUB_ORG environment variables)
+    import uvloop
 
     async def main() -> None:
         """Run the GitHub agent example to demonstrate repository analysis."""
         try:
-            logfire.info(f"Running GitHub agent with this: {GitHubConn()!s}")
             deps_instance = GitHubDependencies(repo_name="pydantic-ai-temporal-example", pr_number=1)
-            logfire.info(f"Running GitHub agent with deps: {deps_instance}")
-            result = await github_agent.run(
+            logfire.info("Running GitHub agent on {repo_name}", repo_name=deps_instance.repo_name)
+            result = await get_github_agent().run(
                 "Show me the branches in this repository entitled pydantic-ai-temporal-example",
                 deps=deps_instance,  # type: ignore[arg-type]
             )
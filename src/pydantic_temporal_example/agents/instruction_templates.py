@@ -175,6 +175,12 @@ GITHUB_ROLE_INSTRUCTIONS = {
     """,
 }
 
+# Base + role instructions, combined once at import since both parts are constants
+_GITHUB_COMBINED_INSTRUCTIONS = {
+    role: f"{GITHUB_BASE_INSTRUCTIONS}\n\n{role_instructions}"
+    for role, role_instructions in GITHUB_ROLE_INSTRUCTIONS.items()
+}
+
 
 def get_instructions_for_role(agent_type: str, agent_role: str) -> str:
     """Get combined instructions for a specific agent role.
@@ -192,9 +198,7 @@ def get_instructions_for_role(agent_type: str, agent_role: str) -> str:
         True
     """
     if agent_type == "github":
-        base = GITHUB_BASE_INSTRUCTIONS
-        role_instructions = GITHUB_ROLE_INSTRUCTIONS.get(agent_role, GITHUB_ROLE_INSTRUCTIONS["default"])
-        return f"{base}\n\n{role_instructions}"
+        return _GITHUB_COMBINED_INSTRUCTIONS.get(agent_role, _GITHUB_COMBINED_INSTRUCTIONS["default"])
 
     # Add other agent types here as needed
     return "Default agent instructions"
@@ -9,11 +9,12 @@ Key Innovation: ONE agent implementation + DIFFERENT instructions = MULTIPLE spe
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from pydantic_ai import Agent
 
-from pydantic_temporal_example.agents.github_agent import GitHubDependencies, GitHubResponse, github_agent
+from pydantic_temporal_example.agents.github_agent import GitHubDependencies, GitHubResponse, get_github_agent
 from pydantic_temporal_example.agents.instruction_templates import get_instructions_for_role, list_available_roles
 from pydantic_temporal_example.agents.web_research_agent import build_web_research_agent
 from pydantic_temporal_example.config import get_github_agent_model
@@ -36,23 +37,25 @@ def _create_github_agent_with_role(role: str) -> Agent[GitHubDependencies, GitHu
     # Get role-specific instructions
     instructions = get_instructions_for_role("github", role)
 
-    # Extract toolsets from base github_agent using public API
-    # The toolsets parameter accepts the full toolset list from another agent
-    toolsets_list = None
-    if hasattr(github_agent, "toolsets") and github_agent.toolsets:
-        toolsets_list = github_agent.toolsets
-
-    # Create new agent with same configuration but different instructions
-    # Pass the toolsets from the base agent via public API
+    # Create new agent with same configuration but different instructions, sharing the base
+    # github_agent's toolsets (always non-empty: it includes the function toolset holding its tools)
     return Agent(
         model=get_github_agent_model(),
         output_type=GitHubResponse,
         deps_type=GitHubDependencies,
         instructions=instructions,
-        toolsets=toolsets_list,  # Use toolsets from base agent via public API
+        toolsets=get_github_agent().toolsets,
     )
 
 
+# Agent builders keyed by agent type; each takes the requested role
+_AGENT_BUILDERS: dict[str, Callable[[str], Any]] = {
+    "github": _create_github_agent_with_role,
+    # Web research doesn't have multiple roles yet, use default
+    "web_research": lambda _role: build_web_research_agent(),
+}
+
+
 def get_agent(agent_type: str, agent_role: str = "default") -> Any:
     """Get agent with role-specific instructions (dynamically created).
 
@@ -75,33 +78,30 @@ def get_agent(agent_type: str, agent_role: str = "default") -> Any:
         >>> agent = get_agent("github", "fixer")     # Creates fixer with fix instructions
         >>> agent = get_agent("web_research")        # Uses default role
     """
-    # Check cache first
-    key = (agent_type, agent_role)
-    if key in _AGENT_CACHE:
-        return _AGENT_CACHE[key]
-
-    # Create agent based on type
-    if agent_type == "github":
-        # Dynamically create GitHub agent with role-specific instructions
-        agent = _create_github_agent_with_role(agent_role)
-        _AGENT_CACHE[key] = agent
-        return agent
-
-    if agent_type == "web_research":
-        # Web research doesn't have multiple roles yet, use default
-        if key not in _AGENT_CACHE:
-            _AGENT_CACHE[key] = build_web_research_agent()
-        return _AGENT_CACHE[key]
-
     if agent_type == "slack":
         # Slack is a direct response, no agent needed
         return None
 
-    # Agent type not supported
-    msg = f"Agent type '{agent_type}' not supported. Available types: github, web_research, slack"
-    raise KeyError(
-        msg,
-    )
+    # Check cache first (a single lookup; builders can return None, which is not stored)
+    key = (agent_type, agent_role)
+    agent = _AGENT_CACHE.get(key)
+    if agent is not None:
+        return agent
+
+    # Create agent based on type
+    builder = _AGENT_BUILDERS.get(agent_type)
+    if builder is None:
+        # Agent type not supported
+        available = ", ".join([*_AGENT_BUILDERS, "slack"])
+        msg = f"Agent type '{agent_type}' not supported. Available types: {available}"
+        raise KeyError(
+            msg,
+        )
+
+    agent = builder(agent_role)
+    if agent is not None:
+        _AGENT_CACHE[key] = agent
+    return agent
 
 
 def list_available_agent_roles() -> dict[str, list[str]]:
@@ -132,3 +132,5 @@ def clear_agent_cache() -> None:
     with updated instructions or configuration.
     """
     _AGENT_CACHE.clear()
+    get_github_agent.cache_clear()
+    build_web_research_agent.cache_clear()
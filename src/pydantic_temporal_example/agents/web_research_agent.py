@@ -2,39 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import cache
 from typing import Any
 
-from pydantic import with_config
+from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai_claude_code import ClaudeCodeModel, ClaudeCodeProvider
 
 from pydantic_temporal_example.config import get_settings
-from pydantic_temporal_example.tools import jina_search_tool
+from pydantic_temporal_example.tools import jina_multi_search_tool, jina_search_tool
 
 provider = ClaudeCodeProvider({"use_sandbox_runtime": False})
 instance_model = ClaudeCodeModel("opus", provider=provider)
-web_research_agent = Agent(model=instance_model)
 
 
-@dataclass
-@with_config(use_attribute_docstrings=True)
-class WebResearchResponse:
+class WebResearchResponse(BaseModel):
     """Structured output for responses produced by the web research agent."""
 
-    response: str | list[dict[str, Any]]
-    """
-    The formatted message to show to the user.
-
-    This should either be a markdown text string, or valid Slack Block Kit blocks.
-    """
+    response: str | list[dict[str, Any]] = Field(
+        description=(
+            "The formatted message to show to the user. "
+            "This should either be a markdown text string, or valid Slack Block Kit blocks."
+        ),
+    )
 
 
 # Settings are fetched in the builder to avoid import-time side effects.
 
 
+@cache
 def build_web_research_agent() -> Agent[None, WebResearchResponse] | None:
-    """Construct the web research agent, validating `JINA_API_KEY` at build time."""
+    """Construct the web research agent, validating `JINA_API_KEY` at build time.
+
+    Cached so the agent (and its output schema) is only constructed once per process.
+    """
     settings = get_settings()
     jina_api_key = settings.JINA_API_KEY
 
@@ -44,7 +45,7 @@ def build_web_research_agent() -> Agent[None, WebResearchResponse] | None:
     return Agent[None, WebResearchResponse](
         model=instance_model,
         output_type=WebResearchResponse,
-        tools=[jina_search_tool(jina_api_key)],
+        tools=[jina_search_tool(jina_api_key), jina_multi_search_tool(jina_api_key)],
         system_prompt="""You are a web research assistant.
 
     You will receive a WebResearchRequest with:
@@ -55,6 +56,7 @@ def build_web_research_agent() -> Agent[None, WebResearchResponse] | None:
 
     - Disambiguate briefly if needed.
     - Use tools for current info; cite sources and dates inline.
+    - When several independent searches are needed, run them together with jina_multi_search.
     - Return concise Markdown or valid Slack Block Kit blocks.
     """,
     )
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Annotated, Any, assert_never
+from hashlib import blake2b
+from typing import Annotated, assert_never
 
 import logfire
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from starlette.responses import JSONResponse, Response
+from starlette.requests import Request
+from starlette.responses import Response
 from temporalio.exceptions import TemporalError
+from temporalio.service import RPCError, RPCStatusCode
 
 from pydantic_temporal_example.config import get_settings
 from pydantic_temporal_example.dependencies import TemporalClient, get_slack_bot_user_id, get_temporal_client
@@ -25,7 +29,7 @@ from pydantic_temporal_example.temporal.workflows import (
     PeriodicGitHubPRCheckWorkflow,
     SlackThreadWorkflow,
 )
-from pydantic_temporal_example.tools.slack import get_verified_slack_events_body
+from pydantic_temporal_example.tools.slack import UnknownSlackPayloadError, get_verified_slack_events_body
 
 router = APIRouter()
 
@@ -34,63 +38,107 @@ router = APIRouter()
 async def handle_event(
     *,
     temporal_client: Annotated[TemporalClient, Depends(get_temporal_client)],
+    background_tasks: BackgroundTasks,
     slack_bot_user_id: Annotated[str | None, Depends(get_slack_bot_user_id)],
     body: Annotated[
-        SlackEventsAPIBody | URLVerificationEvent | dict[str, Any],
+        SlackEventsAPIBody | URLVerificationEvent,
         Depends(get_verified_slack_events_body),
     ],
 ) -> Response:
     """This should be used as the endpoint for the Slack Events API for your bot."""
-    if isinstance(body, dict):
-        logfire.warning("Unhandled Slack event", body=body)
-    elif isinstance(body, URLVerificationEvent):
+    if isinstance(body, URLVerificationEvent):
         return await handle_url_verification_event(body)
     elif isinstance(body, SlackEventsAPIBody):
-        if isinstance(body.event, AppMentionEvent):
-            return await handle_app_mention_event(body.event, temporal_client)
-        if isinstance(body.event, MessageChannelsEvent):
-            if slack_bot_user_id and body.event.user == slack_bot_user_id:
-                logfire.info("Ignoring event for message created by this bot")
-            else:
-                return await handle_message_channels_event(body.event, temporal_client)
-        else:
-            assert_never(body.event)
+        # The event union is already discriminated on `type`, so each case sees the narrowed event type
+        event = body.event
+        match event:
+            case AppMentionEvent():
+                return await handle_app_mention_event(event, temporal_client, background_tasks)
+            case MessageChannelsEvent():
+                if slack_bot_user_id and event.user == slack_bot_user_id:
+                    logfire.info("Ignoring event for message created by this bot")
+                else:
+                    return await handle_message_channels_event(event, temporal_client, background_tasks)
+            case _:
+                assert_never(event)
     else:
         assert_never(body)
 
     return Response(status_code=204)
 
 
-async def handle_url_verification_event(event: URLVerificationEvent) -> JSONResponse:
+def _slack_thread_workflow_id(thread_ts: str) -> str:
+    """Return the ID of the `SlackThreadWorkflow` that owns the thread started at `thread_ts`."""
+    return f"app-mention-{thread_ts.replace('.', '-')}"
+
+
+async def handle_unknown_slack_payload(_request: Request, exc: Exception) -> Response:
+    """Acknowledge verified Slack payloads that no handler supports, so Slack does not retry them."""
+    payload = exc.payload if isinstance(exc, UnknownSlackPayloadError) else None
+    logfire.warning("Unhandled Slack event", body=payload)
+    return Response(status_code=204)
+
+
+async def handle_url_verification_event(event: URLVerificationEvent) -> ORJSONResponse:
     """Return Slack URL verification challenge back to Slack."""
-    return JSONResponse(content={"challenge": event.challenge})
+    return ORJSONResponse(content={"challenge": event.challenge})
 
 
-async def handle_app_mention_event(event: AppMentionEvent, temporal_client: TemporalClient) -> Response:
-    """Start a workflow for a Slack thread when the bot is app-mentioned."""
+async def handle_app_mention_event(
+    event: AppMentionEvent,
+    temporal_client: TemporalClient,
+    background_tasks: BackgroundTasks,
+) -> Response:
+    """Start a workflow for a Slack thread when the bot is app-mentioned.
+
+    The workflow is started in the background so Slack gets its 204 without waiting on Temporal.
+    """
+    background_tasks.add_task(_start_slack_thread_workflow, event, temporal_client)
+    return Response(status_code=204)
+
+
+async def _start_slack_thread_workflow(event: AppMentionEvent, temporal_client: TemporalClient) -> None:
     settings = get_settings()
-    workflow_id = f"app-mention-{event.reply_thread_ts.replace('.', '-')}"
-    await temporal_client.start_workflow(
-        SlackThreadWorkflow.run,
-        id=workflow_id,
-        start_signal="submit_app_mention_event",
-        start_signal_args=[event],
-        task_queue=settings.temporal_task_queue,
-    )
+    workflow_id = _slack_thread_workflow_id(event.reply_thread_ts)
+    try:
+        await temporal_client.start_workflow(
+            SlackThreadWorkflow.run,
+            id=workflow_id,
+            start_signal="submit_app_mention_event",
+            start_signal_args=[event],
+            task_queue=settings.temporal_task_queue,
+        )
+    except TemporalError:
+        # Slack has already been acknowledged and will not retry, so record the lost event
+        logfire.exception("Failed to start Slack thread workflow", workflow_id=workflow_id)
+
+
+async def handle_message_channels_event(
+    event: MessageChannelsEvent,
+    temporal_client: TemporalClient,
+    background_tasks: BackgroundTasks,
+) -> Response:
+    """Signal an existing workflow with a new message or ignore if none exists yet.
+
+    The signal is sent in the background so Slack gets its 204 without waiting on Temporal.
+    """
+    background_tasks.add_task(_signal_slack_thread_workflow, event, temporal_client)
     return Response(status_code=204)
 
 
-async def handle_message_channels_event(event: MessageChannelsEvent, temporal_client: TemporalClient) -> Response:
-    """Signal an existing workflow with a new message or ignore if none exists yet."""
-    maybe_workflow_id = f"app-mention-{event.reply_thread_ts.replace('.', '-')}"
+async def _signal_slack_thread_workflow(event: MessageChannelsEvent, temporal_client: TemporalClient) -> None:
+    maybe_workflow_id = _slack_thread_workflow_id(event.reply_thread_ts)
     maybe_handle = temporal_client.get_workflow_handle_for(SlackThreadWorkflow.run, workflow_id=maybe_workflow_id)
     try:
-        await maybe_handle.describe()
+        # Signal directly: Temporal rejects signals to unknown workflows, so no describe() round-trip is needed
         await maybe_handle.signal("submit_message_channels_event", args=[event])
-    except TemporalError:
-        # workflow doesn't exist yet, do nothing other than record what happened
-        logfire.info("No workflow found for this thread")
-    return Response(status_code=204)
+    except TemporalError as e:
+        if isinstance(e, RPCError) and e.status != RPCStatusCode.NOT_FOUND:
+            # Slack has already been acknowledged and will not retry, so record the lost event
+            logfire.exception("Failed to signal Slack thread workflow", workflow_id=maybe_workflow_id)
+        else:
+            # workflow doesn't exist yet, do nothing other than record what happened
+            logfire.info("No workflow found for this thread")
 
 
 # CLI Request/Response Models
@@ -117,6 +165,10 @@ class CLIWorkflowAssignmentResponse(BaseModel):
             "handle composite IDs automatically."
         ),
     )
+    periodic_workflow_id: str | None = Field(
+        default=None,
+        description="ID of the periodic workflow when repeat=True, so clients need not split the composite ID",
+    )
     message: str = Field(..., description="Human-readable message")
     is_repeating: bool = Field(default=False, description="Whether this is a repeating workflow")
 
@@ -126,17 +178,20 @@ async def submit_cli_workflow(
     *,
     temporal_client: Annotated[TemporalClient, Depends(get_temporal_client)],
     request: CLIWorkflowRequest,
-) -> JSONResponse:
+) -> Response:
     """Submit a CLI workflow and return assignment confirmation."""
+    task_queue = get_settings().temporal_task_queue
     try:
-        # Generate unique workflow ID
-        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-        workflow_id = f"cli-workflow-{timestamp}-{hash(request.prompt) % 10000:04d}"
+        # Generate unique workflow ID; blake2b (unlike the salted built-in `hash`) gives the same suffix in every process
+        now = datetime.now(UTC)
+        timestamp = now.strftime("%Y%m%d-%H%M%S")
+        prompt_digest = blake2b(request.prompt.encode(), digest_size=3).hexdigest()
+        workflow_id = f"cli-workflow-{timestamp}-{prompt_digest}"
 
         # Create CLI prompt event
         cli_event = CLIPromptEvent(
             prompt=request.prompt,
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=now.isoformat(),
             session_id=request.session_id,
         )
 
@@ -146,7 +201,7 @@ async def submit_cli_workflow(
             id=workflow_id,
             start_signal="submit_prompt",
             start_signal_args=[cli_event],
-            task_queue=get_settings().temporal_task_queue,
+            task_queue=task_queue,
         )
 
         # If repeat is requested, start a periodic workflow
@@ -157,12 +212,13 @@ async def submit_cli_workflow(
                 PeriodicGitHubPRCheckWorkflow.periodic_run,
                 args=[request.repo_name, request.repeat_interval, request.prompt],
                 id=periodic_workflow_id,
-                task_queue=get_settings().temporal_task_queue,
+                task_queue=task_queue,
             )
 
             response = CLIWorkflowAssignmentResponse(
                 success=True,
                 workflow_id=f"{workflow_id},{periodic_workflow_id}",
+                periodic_workflow_id=periodic_workflow_id,
                 message="Workflow assigned to worker. (Repeating mode enabled)",
                 is_repeating=True,
             )
@@ -175,7 +231,8 @@ async def submit_cli_workflow(
             )
 
         logfire.info("CLI workflow submitted", workflow_id=response.workflow_id, prompt=request.prompt)
-        return JSONResponse(content=response.model_dump())
+        # Serialize the model straight to JSON bytes, skipping the intermediate dict
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except Exception as e:
         logfire.error("Failed to submit CLI workflow", error=str(e))
@@ -187,7 +244,7 @@ async def get_cli_workflow_response(
     *,
     temporal_client: Annotated[TemporalClient, Depends(get_temporal_client)],
     workflow_id: str,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Retrieve the latest response from a CLI workflow.
 
     Handles both single workflow IDs and composite IDs (comma-separated).
@@ -206,9 +263,9 @@ async def get_cli_workflow_response(
         response = await handle.query(CLIConversationWorkflow.get_latest_response)
 
         if response is None:
-            return JSONResponse(content={"status": "pending", "response": None, "workflow_id": first_workflow_id})
+            return ORJSONResponse(content={"status": "pending", "response": None, "workflow_id": first_workflow_id})
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "completed",
                 "response": response.model_dump(),
@@ -228,7 +285,7 @@ async def stop_cli_workflow(
     *,
     temporal_client: Annotated[TemporalClient, Depends(get_temporal_client)],
     workflow_id: str,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Stop a running CLI workflow.
 
     Handles both single workflow IDs and composite IDs (comma-separated).
@@ -275,7 +332,7 @@ async def stop_cli_workflow(
             if failed_workflows:
                 message += f"; {len(failed_workflows)} workflow(s) not found or already stopped"
 
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "success": True,
                     "message": message,
@@ -4,18 +4,17 @@ import logfire
 import uvicorn
 import uvloop
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from pydantic_temporal_example.api import router
+from pydantic_temporal_example.api import handle_unknown_slack_payload, router
 from pydantic_temporal_example.dependencies import lifespan
 from pydantic_temporal_example.temporal.worker import temporal_worker
+from pydantic_temporal_example.tools.slack import UnknownSlackPayloadError
 
-# Configure logfire once at module level (before app creation)
-logfire.configure(console=None)
-logfire.instrument_pydantic_ai()
-logfire.instrument_httpx(capture_all=True)
-
-app = FastAPI(lifespan=lifespan)
+# Logfire itself is configured once by the package (see `setup_logfire`)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(router)
+app.add_exception_handler(UnknownSlackPayloadError, handle_unknown_slack_payload)
 
 logfire.instrument_fastapi(app)
 
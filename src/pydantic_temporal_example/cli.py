@@ -15,13 +15,10 @@ import logfire
 import typer
 import uvloop
 
-from pydantic_temporal_example.agents.github_agent import GitHubDependencies, github_agent
 from pydantic_temporal_example.config import get_settings
-from pydantic_temporal_example.temporal.client import build_temporal_client
-from pydantic_temporal_example.temporal.github_activities import fetch_github_prs
-from pydantic_temporal_example.temporal.worker import temporal_worker
-from pydantic_temporal_example.temporal.workflows import PeriodicGitHubPRCheckWorkflow
-from pydantic_temporal_example.tools.jina_search import jina_search
+
+# Agent, Temporal and search modules are imported inside the commands that use them, so `--help` and the
+# HTTP client helpers don't pay for building every agent at import time.
 
 app = typer.Typer()
 
@@ -175,6 +172,7 @@ def github_prs(
     ] = "List all pull requests in the repository",
 ) -> None:
     """Query GitHub agent for all PRs once using Temporal activity."""
+    from pydantic_temporal_example.temporal.github_activities import fetch_github_prs
 
     async def _run() -> None:
         logfire.info(f"Fetching all PRs from {repo}...")
@@ -200,6 +198,8 @@ def github_prs_periodic(
     ] = "List all pull requests in the repository",
 ) -> None:
     """Run periodic GitHub PR checks using Temporal workflow."""
+    from pydantic_temporal_example.temporal.client import build_temporal_client
+    from pydantic_temporal_example.temporal.workflows import PeriodicGitHubPRCheckWorkflow
 
     async def _run() -> None:
         logfire.info(f"Starting periodic PR checks for {repo} every {interval}s...")
@@ -242,8 +242,9 @@ def jina_research(
     iterations: Annotated[int, typer.Option(help="Number of iterations (0 = infinite)")] = 0,
 ) -> None:
     """Run periodic Jina research on a topic."""
+    from pydantic_temporal_example.tools.jina_search import close_jina_clients, jina_search
 
-    async def _run() -> None:
+    async def _research() -> None:
         count = 0
         while True:
             count += 1
@@ -268,6 +269,12 @@ def jina_research(
                 logfire.info(f"Waiting {interval} seconds before next iteration...")
                 await asyncio.sleep(interval)
 
+    async def _run() -> None:
+        try:
+            await _research()
+        finally:
+            await close_jina_clients()
+
     asyncio.run(_run())
 
 
@@ -278,12 +285,14 @@ def combined_task(
     research_interval: Annotated[int, typer.Option(help="Research interval in seconds")] = 30,
 ) -> None:
     """Run both GitHub PR analysis and periodic Jina research concurrently."""
+    from pydantic_temporal_example.agents.github_agent import GitHubDependencies, get_github_agent
+    from pydantic_temporal_example.tools.jina_search import close_jina_clients, jina_search
 
     async def github_task() -> None:
         deps = GitHubDependencies(repo_name=repo)
 
         logfire.info(f"Fetching all PRs from {repo}...")
-        await github_agent.run(
+        await get_github_agent().run(
             "List all pull requests in the repository and include their comments for each PR",
             deps=deps,  # type: ignore[arg-type]
         )
@@ -310,10 +319,13 @@ def combined_task(
 
     async def _run() -> None:
         # Run both tasks concurrently
-        await asyncio.gather(
-            github_task(),
-            jina_task(),
-        )
+        try:
+            await asyncio.gather(
+                github_task(),
+                jina_task(),
+            )
+        finally:
+            await close_jina_clients()
 
     asyncio.run(_run())
 
@@ -343,6 +355,8 @@ def main(
     ] = None,
 ) -> None:
     """Temporal Agent CLI."""
+    from pydantic_temporal_example.temporal.worker import temporal_worker
+
     # Resolve settings at runtime, not at import time
     settings = get_settings()
     host = host or settings.temporal_host
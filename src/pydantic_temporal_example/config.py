@@ -2,7 +2,7 @@
 
 from functools import cache
 
-from pydantic import AliasChoices, Field
+from pydantic import AliasChoices, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,11 +24,16 @@ class Settings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
-    slack_bot_token: str | None = None
-    slack_signing_secret: str | None = None
+    slack_bot_token: SecretStr | None = None
+    slack_signing_secret: SecretStr | None = None
     temporal_host: str | None = None
     temporal_port: int = Field(default=7233, ge=1, le=65535, description="Temporal server port")
-    temporal_task_queue: str = "agent-task-queue"
+    temporal_task_queue: str = Field(
+        default="agent-task-queue",
+        min_length=1,
+        pattern=r"\S",
+        description="Temporal task queue name",
+    )
     app_host: str = "127.0.0.1"
     app_port: int = Field(default=4000, ge=1, le=65535, description="FastAPI app port")
     cli_timeout: int = Field(default=30, ge=1, le=300, description="CLI request timeout in seconds")
@@ -61,7 +61,9 @@ async def lifespan(_server: FastAPI) -> AsyncIterator[dict[str, Any]]:
     try:
         # Initialize Slack client (optional)
         if settings.slack_bot_token:
-            slack_client, slack_bot_user_id = await _initialize_slack_client(settings.slack_bot_token)
+            slack_client, slack_bot_user_id = await _initialize_slack_client(
+                settings.slack_bot_token.get_secret_value()
+            )
         else:
             logfire.info("Slack token not provided, Slack integration disabled")
 
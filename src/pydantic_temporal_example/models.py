@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Discriminator, TypeAdapter
+from pydantic import BaseModel, ConfigDict, Discriminator, TypeAdapter
 
 
 class MessageChannelsEvent(BaseModel):
     """Slack `message` event with channel context and thread metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["message"]
     user: str
     text: str
@@ -28,6 +30,8 @@ class MessageChannelsEvent(BaseModel):
 class AppMentionEvent(BaseModel):
     """Slack `app_mention` event capturing the mention context in a thread."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["app_mention"]
     user: str
     text: str
@@ -45,6 +49,8 @@ class AppMentionEvent(BaseModel):
 class URLVerificationEvent(BaseModel):
     """Slack Events API URL verification challenge payload."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["url_verification"]
     token: str
     challenge: str
@@ -59,6 +65,8 @@ type SlackEvent = Annotated[
 class SlackEventsAPIBody(BaseModel):
     """Envelope for Slack Events API callbacks carrying the event and metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     token: str
     team_id: str  # | None = None
     api_app_id: str  # | None = None
@@ -69,14 +77,18 @@ class SlackEventsAPIBody(BaseModel):
     authed_users: list[str] | None = None
 
 
-SlackEventsAPIBodyAdapter: TypeAdapter[SlackEventsAPIBody | URLVerificationEvent | dict[str, Any]] = TypeAdapter(
-    Annotated[SlackEventsAPIBody | URLVerificationEvent, Discriminator("type")] | dict[str, Any],
+SlackEventsAPIBodyAdapter: TypeAdapter[SlackEventsAPIBody | URLVerificationEvent] = TypeAdapter(
+    Annotated[SlackEventsAPIBody | URLVerificationEvent, Discriminator("type")],
 )
+# Bound once so the webhook path calls the validator directly
+validate_slack_events_body_json = SlackEventsAPIBodyAdapter.validate_json
 
 
 class SlackMessageID(BaseModel):
     """Identifier for a Slack message, consisting of channel and timestamp."""
 
+    model_config = ConfigDict(frozen=True)
+
     channel: str
     ts: str
 
@@ -84,6 +96,8 @@ class SlackMessageID(BaseModel):
 class SlackReply(BaseModel):
     """A response payload to post in a Slack thread."""
 
+    model_config = ConfigDict(frozen=True)
+
     thread: SlackMessageID
     content: str | list[dict[str, Any]]
 
@@ -101,6 +115,8 @@ class SlackReply(BaseModel):
 class SlackReaction(BaseModel):
     """A reaction event targeting a specific Slack message."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: SlackMessageID
     name: str
 
@@ -108,6 +124,8 @@ class SlackReaction(BaseModel):
 class SlackConversationsRepliesRequest(BaseModel):
     """Request parameters to fetch replies for a Slack thread."""
 
+    model_config = ConfigDict(frozen=True)
+
     # See https://docs.slack.dev/reference/methods/conversations.replies/
 
     channel: str
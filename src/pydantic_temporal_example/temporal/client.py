@@ -3,7 +3,9 @@
 from pydantic_ai.durable_exec.temporal import LogfirePlugin, PydanticAIPlugin
 from temporalio.client import Client as TemporalClient
 
+from pydantic_temporal_example import setup_logfire
 from pydantic_temporal_example.config import get_settings
+from pydantic_temporal_example.temporal.converter import TrustedPayloadPlugin
 
 
 async def build_temporal_client(host: str | None = None, port: int | None = None) -> TemporalClient:
@@ -14,7 +16,7 @@ async def build_temporal_client(host: str | None = None, port: int | None = None
         port: Temporal server port. Falls back to settings.temporal_port (7233)
 
     Returns:
-        Connected TemporalClient instance configured with PydanticAI and Logfire plugins
+        Connected TemporalClient instance configured with PydanticAI, trusted-payload and Logfire plugins
 
     Raises:
         ValueError: If port is None after resolution from settings
@@ -26,5 +28,7 @@ async def build_temporal_client(host: str | None = None, port: int | None = None
 
     return await TemporalClient.connect(
         f"{temporal_host}:{temporal_port}",
-        plugins=[PydanticAIPlugin(), LogfirePlugin()],
+        # TrustedPayloadPlugin must follow PydanticAIPlugin, which replaces any custom data converter
+        # LogfirePlugin reuses the package's Logfire setup instead of calling logfire.configure() on every connect
+        plugins=[PydanticAIPlugin(), TrustedPayloadPlugin(), LogfirePlugin(setup_logfire)],
     )
@@ -0,0 +1,88 @@
+"""Temporal data converter that skips re-validation of trusted internal payloads."""
+
+from typing import Any, cast
+
+import temporalio.api.common.v1
+from pydantic import BaseModel
+from pydantic_core import from_json
+from temporalio.client import ClientConfig, Plugin as ClientPlugin
+from temporalio.contrib.pydantic import PydanticJSONPlainPayloadConverter
+from temporalio.converter import (
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    JSONPlainPayloadConverter,
+)
+from temporalio.service import ConnectConfig, ServiceClient
+
+from pydantic_temporal_example.models import (
+    AppMentionEvent,
+    CLIPromptEvent,
+    MessageChannelsEvent,
+    SlackConversationsRepliesRequest,
+    SlackMessageID,
+)
+
+# Models that only ever reach Temporal after being validated by this app (Slack events are validated at the
+# webhook boundary). Only flat models belong here: `model_construct` does not rebuild nested models.
+TRUSTED_MODELS: frozenset[type[BaseModel]] = frozenset(
+    {
+        AppMentionEvent,
+        MessageChannelsEvent,
+        CLIPromptEvent,
+        SlackMessageID,
+        SlackConversationsRepliesRequest,
+    },
+)
+
+
+class TrustedPydanticJSONPlainPayloadConverter(PydanticJSONPlainPayloadConverter):
+    """Pydantic JSON payload converter that builds trusted models with `model_construct`."""
+
+    def from_payload(
+        self,
+        payload: temporalio.api.common.v1.Payload,
+        type_hint: type | None = None,
+    ) -> Any:
+        """Decode a payload, skipping validation when `type_hint` is a trusted internal model."""
+        if type_hint in TRUSTED_MODELS:
+            model = cast("type[BaseModel]", type_hint)
+            return model.model_construct(**from_json(payload.data))
+        return super().from_payload(payload, type_hint)  # pyright: ignore[reportUnknownMemberType]
+
+
+class TrustedPydanticPayloadConverter(CompositePayloadConverter):
+    """Pydantic payload converter using `TrustedPydanticJSONPlainPayloadConverter` for JSON."""
+
+    def __init__(self) -> None:
+        """Initialize the composite converter with the trusted JSON converter in place of the default one."""
+        json_payload_converter = TrustedPydanticJSONPlainPayloadConverter()
+        super().__init__(
+            *(
+                json_payload_converter if isinstance(c, JSONPlainPayloadConverter) else c
+                for c in DefaultPayloadConverter.default_encoding_payload_converters
+            ),
+        )
+
+
+trusted_pydantic_data_converter = DataConverter(payload_converter_class=TrustedPydanticPayloadConverter)
+
+
+class TrustedPayloadPlugin(ClientPlugin):
+    """Client plugin installing `trusted_pydantic_data_converter`.
+
+    Must come after `PydanticAIPlugin` in the plugin list, since that plugin replaces any custom data converter.
+    """
+
+    def init_client_plugin(self, next: ClientPlugin) -> None:
+        """Store the next plugin in the chain."""
+        self.next_client_plugin = next
+
+    def configure_client(self, config: ClientConfig) -> ClientConfig:
+        """Swap in the trusted data converter."""
+        config["data_converter"] = trusted_pydantic_data_converter
+        return self.next_client_plugin.configure_client(config)
+
+    async def connect_service_client(self, config: ConnectConfig) -> ServiceClient:
+        """Delegate service connection to the next plugin."""
+        return await self.next_client_plugin.connect_service_client(config)
@@ -14,14 +14,16 @@ from typing import TYPE_CHECKING, Any
 from pydantic_ai.durable_exec.temporal import TemporalAgent
 from temporalio import workflow
 
-from pydantic_temporal_example.agents.github_agent import GitHubDependencies, GitHubResponse
+from pydantic_temporal_example.agents.github_agent import GitHubDependencies
 from pydantic_temporal_example.agents.registry import get_agent
-from pydantic_temporal_example.agents.web_research_agent import WebResearchResponse
 from pydantic_temporal_example.models import CLIResponse
 
 if TYPE_CHECKING:
     from temporalio.workflow import ActivityConfig
 
+# Agents are run without a run-level `output_type`: each registry agent already has its output type, and passing it
+# again would make pydantic-ai rebuild the output schema on every run
+
 # Activity config with 5-minute timeout for agent operations
 _agent_activity_config: ActivityConfig = {"start_to_close_timeout": timedelta(minutes=5)}
 
@@ -83,14 +85,14 @@ class GenericOneShotWorkflow:
                 # Prepare dependencies based on agent type
                 if agent_type == "github":
                     deps = GitHubDependencies(repo_name=self._repo_name)
-                    result = await temporal_agent.run(query, output_type=GitHubResponse, deps=deps)  # type: ignore[call-arg, arg-type]
+                    result = await temporal_agent.run(query, deps=deps)
                     response = result.output.response
                 elif agent_type == "web_research":
-                    result = await temporal_agent.run(query, output_type=WebResearchResponse)
+                    result = await temporal_agent.run(query)
                     response = result.output.response
                 else:
                     # Generic execution
-                    result = await temporal_agent.run(query, output_type=str)
+                    result = await temporal_agent.run(query)
                     response = str(result.output)
 
                 workflow.logger.info(f"Agent executed successfully: {agent_type}/{agent_role}")
@@ -102,8 +104,8 @@ class GenericOneShotWorkflow:
             workflow.logger.error(f"Agent execution failed: {e}")
             response = f"Error executing agent: {e!s}"
 
-        # Store response
-        self._latest_response = CLIResponse(
+        # Store response (content is already-validated agent output)
+        self._latest_response = CLIResponse.model_construct(
             content=response,
             metadata={
                 "agent_type": agent_type,
@@ -201,13 +203,13 @@ class GenericPeriodicWorkflow:
                 # Execute agent based on type
                 if agent_type == "github":
                     deps = GitHubDependencies(repo_name=self._repo_name)
-                    result = await temporal_agent.run(query, output_type=GitHubResponse, deps=deps)  # type: ignore[call-arg, arg-type]
+                    result = await temporal_agent.run(query, deps=deps)
                     response = result.output.response
                 elif agent_type == "web_research":
-                    result = await temporal_agent.run(query, output_type=WebResearchResponse)
+                    result = await temporal_agent.run(query)
                     response = result.output.response
                 else:
-                    result = await temporal_agent.run(query, output_type=str)
+                    result = await temporal_agent.run(query)
                     response = str(result.output)
 
                 # Store response
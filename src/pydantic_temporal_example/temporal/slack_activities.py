@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 # pyright: reportUnknownMemberType=false
+from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 
+import aiohttp
 from slack_sdk.web.async_client import AsyncWebClient as SlackClient
 from temporalio import activity
 
@@ -27,11 +29,18 @@ if TYPE_CHECKING:
 
 import logfire
 
+# Fields of a Slack message that the dispatch agent needs; everything else only bloats the workflow history and prompt.
+# Block Kit replies (including the bot's own) are posted without `text`, so their content only lives in `blocks`.
+_THREAD_MESSAGE_FIELDS = ("ts", "user", "bot_id", "text", "blocks", "files", "attachments")
+
 
 @activity.defn
 @logfire.instrument
 async def slack_conversations_replies(request: SlackConversationsRepliesRequest) -> list[dict[str, Any]]:
-    """Fetch messages in a Slack thread, handling pagination via `has_more` and `cursor`."""
+    """Fetch messages in a Slack thread, handling pagination via `has_more` and `cursor`.
+
+    Each message is trimmed to the fields in `_THREAD_MESSAGE_FIELDS`.
+    """
     has_more = True
     cursor = None
     messages: list[dict[str, Any]] = []
@@ -43,10 +52,14 @@ async def slack_conversations_replies(request: SlackConversationsRepliesRequest)
             cursor=cursor,
         )
         response_messages = cast("list[dict[str, Any]]", response["messages"])
-        messages.extend(response_messages)
-        has_more = bool(response.get("has_more", False))
+        messages.extend(
+            {key: message[key] for key in _THREAD_MESSAGE_FIELDS if key in message} for message in response_messages
+        )
+        has_more = response.get("has_more", False)
         if has_more:
-            cursor = response.get("response_metadata", {}).get("next_cursor") or None
+            metadata = response.get("response_metadata")
+            # An empty cursor means there is no next page
+            cursor = (metadata.get("next_cursor") if metadata else None) or None
 
     return messages
 
@@ -108,6 +121,28 @@ ALL_SLACK_ACTIVITIES = [
 ]
 
 
+@cache
 def _get_slack_client() -> SlackClient:
+    """Return the worker's shared Slack client.
+
+    One aiohttp session backs every activity call, so connections (and their TLS sessions) are kept alive and
+    reused instead of being re-established per activity. Creation has no awaits, so it cannot race on the loop.
+    """
     settings = get_settings()
-    return SlackClient(token=settings.slack_bot_token.get_secret_value(), timeout=60)
+    if settings.slack_bot_token is None:
+        msg = "SLACK_BOT_TOKEN is required to call the Slack API"
+        raise RuntimeError(msg)
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75),
+    )
+    return SlackClient(token=settings.slack_bot_token.get_secret_value(), timeout=60, session=session)
+
+
+async def close_slack_client() -> None:
+    """Close the shared Slack client's HTTP session, if one was created."""
+    if _get_slack_client.cache_info().currsize == 0:
+        return
+    client = _get_slack_client()
+    _get_slack_client.cache_clear()
+    if client.session is not None:
+        await client.session.close()
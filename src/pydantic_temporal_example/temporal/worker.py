@@ -11,7 +11,7 @@ from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxR
 from pydantic_temporal_example.config import get_settings
 from pydantic_temporal_example.temporal.client import build_temporal_client
 from pydantic_temporal_example.temporal.github_activities import ALL_GITHUB_ACTIVITIES
-from pydantic_temporal_example.temporal.slack_activities import ALL_SLACK_ACTIVITIES
+from pydantic_temporal_example.temporal.slack_activities import ALL_SLACK_ACTIVITIES, close_slack_client
 from pydantic_temporal_example.temporal.workflows import (
     CLIConversationWorkflow,
     PeriodicGitHubPRCheckWorkflow,
@@ -20,6 +20,7 @@ from pydantic_temporal_example.temporal.workflows import (
     temporal_github_agent,
     temporal_web_research_agent,
 )
+from pydantic_temporal_example.tools.jina_search import close_jina_clients
 
 
 @asynccontextmanager
@@ -47,14 +48,18 @@ async def temporal_worker(
     task_queue = task_queue or settings.temporal_task_queue
 
     # Note: resolved_port will always have a value from settings.temporal_port default (7233)
-    # Port validation is already enforced in Settings model via Field constraints
+    # Port validation and the default task queue's validation are already enforced in Settings via Field constraints
 
-    # Validate task_queue
-    if not task_queue or not task_queue.strip():
+    # Validate task_queue, which may come from the caller (e.g. the CLI `--task-queue` option) rather than Settings
+    if not task_queue.strip():
         msg = "task_queue cannot be empty"
         raise ValueError(msg)
 
     async with AsyncExitStack() as stack:
+        # Registered first so the shared HTTP clients are closed after the worker has stopped running activities
+        stack.push_async_callback(close_slack_client)
+        stack.push_async_callback(close_jina_clients)
+
         if host is None:
             workflow_env = await WorkflowEnvironment.start_local(port=resolved_port, ui=True)  # pyright: ignore[reportUnknownMemberType]
             await stack.enter_async_context(workflow_env)
@@ -3,30 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, assert_never
 
 from pydantic_ai.durable_exec.temporal import TemporalAgent
+from pydantic_core import to_json
 from temporalio import workflow
 
 from pydantic_temporal_example.agents.dispatch_agent import (
-    DispatchResult,
     GitHubRequest,
     NoResponse,
     SlackResponse,
     WebResearchRequest,
     dispatch_agent,
 )
-from pydantic_temporal_example.agents.github_agent import (
-    GitHubDependencies,
-    GitHubResponse,
-    github_agent,
-)
-from pydantic_temporal_example.agents.web_research_agent import (
-    WebResearchResponse,
-    build_web_research_agent,
-)
+from pydantic_temporal_example.agents.github_agent import GitHubDependencies, get_github_agent
+from pydantic_temporal_example.agents.web_research_agent import build_web_research_agent
 from pydantic_temporal_example.models import (
     AppMentionEvent,
     CLIPromptEvent,
@@ -47,15 +39,21 @@ from pydantic_temporal_example.temporal.slack_activities import (
 if TYPE_CHECKING:
     from temporalio.workflow import ActivityConfig
 
+# Agents are run without a run-level `output_type`: each already has its output type, and passing it again would
+# make pydantic-ai rebuild the output schema on every run
+
 # Activity config with 5-minute timeout for agent operations
 _agent_activity_config: ActivityConfig = {"start_to_close_timeout": timedelta(minutes=5)}
 
+# Timeout for the short Slack API activities
+_slack_activity_timeout = timedelta(seconds=10)
+
 temporal_dispatch_agent = TemporalAgent(
     dispatch_agent,
     name="dispatch_agent",
     activity_config=_agent_activity_config,
 )
-temporal_github_agent = TemporalAgent(github_agent, name="github_agent", activity_config=_agent_activity_config)
+temporal_github_agent = TemporalAgent(get_github_agent(), name="github_agent", activity_config=_agent_activity_config)
 
 # Build web research agent only if JINA_API_KEY is configured
 _web_research_agent = build_web_research_agent()
@@ -76,23 +74,31 @@ class SlackThreadWorkflow:
     def __init__(self) -> None:
         """Initialize pending event queue and thread message store."""
         self._pending_events: asyncio.Queue[AppMentionEvent | MessageChannelsEvent] = asyncio.Queue()
-        self._thread_messages: list[dict[str, Any]] = []
-
-    @property
-    def _most_recent_ts(self) -> str | None:
-        if not self._thread_messages:
-            return None
-        # assume _thread_messages is always sorted by ts
-        return self._thread_messages[-1]["ts"]
+        # JSON encoding of each thread message seen so far, so each message is only serialized once
+        self._serialized_messages: list[str] = []
+        # ts of the last message seen; replies are returned sorted by ts
+        self._most_recent_ts: str | None = None
 
     @workflow.run
     async def run(self) -> None:
-        """Main workflow loop: waits for queued events and handles each one."""
+        """Main workflow loop: waits for queued events and handles each burst of them once."""
         while True:
             await workflow.wait_condition(lambda: not self._pending_events.empty())
+            # Workflows started before events were coalesced must keep handling each event on replay
+            if not workflow.patched("coalesce-slack-events"):
+                while not self._pending_events.empty():
+                    event = self._pending_events.get_nowait()
+                    await self.handle_event(event)
+                continue
+
+            # All queued events belong to this thread and `handle_event` fetches every message since the last
+            # one seen, so a burst of events is coalesced into a single dispatch. The earliest event is the one
+            # handled: before any message has been seen, its ts bounds the fetch, so no message in the burst is
+            # skipped.
+            event = self._pending_events.get_nowait()
             while not self._pending_events.empty():
-                event = self._pending_events.get_nowait()
-                await self.handle_event(event)
+                self._pending_events.get_nowait()
+            await self.handle_event(event)
 
     @workflow.signal
     async def submit_message_channels_event(self, event: MessageChannelsEvent) -> None:
@@ -106,43 +112,61 @@ class SlackThreadWorkflow:
 
     async def handle_event(self, event: AppMentionEvent | MessageChannelsEvent) -> None:
         """Process a Slack event: fetch updates, dispatch to agents, and post reply."""
-        # add thinking reaction immediately
+        # Workflows started before the Slack activities ran concurrently must replay the original command order
+        parallel_activities = workflow.patched("parallel-slack-activities")
         most_recent_ts = self._most_recent_ts or event.event_ts
         event_message = SlackMessageID(channel=event.channel, ts=most_recent_ts)
-
-        await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
-            slack_reactions_add,
-            SlackReaction(message=event_message, name="spin"),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
-
-        # Get new messages in the thread
         request = SlackConversationsRepliesRequest(
             channel=event.channel,
             ts=event.reply_thread_ts,
             oldest=most_recent_ts,
         )
-        new_messages: list[dict[str, Any]] = await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
-            slack_conversations_replies,
-            request,
-            start_to_close_timeout=timedelta(seconds=10),
-        )
-        self._thread_messages.extend(new_messages)
+
+        new_messages: list[dict[str, Any]]
+        if parallel_activities:
+            # Add thinking reaction and get new messages in the thread concurrently
+            _, new_messages = await asyncio.gather(
+                workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                    slack_reactions_add,
+                    SlackReaction(message=event_message, name="spin"),
+                    start_to_close_timeout=_slack_activity_timeout,
+                ),
+                workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                    slack_conversations_replies,
+                    request,
+                    start_to_close_timeout=_slack_activity_timeout,
+                ),
+            )
+        else:
+            await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                slack_reactions_add,
+                SlackReaction(message=event_message, name="spin"),
+                start_to_close_timeout=_slack_activity_timeout,
+            )
+            new_messages = await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                slack_conversations_replies,
+                request,
+                start_to_close_timeout=_slack_activity_timeout,
+            )
+        self._serialized_messages.extend(to_json(message).decode() for message in new_messages)
+        if new_messages:
+            self._most_recent_ts = new_messages[-1]["ts"]
 
         # Get directive from the dispatch agent
-        # Pass thread messages as JSON string to dispatch agent
-        stringified_thread = json.dumps(self._thread_messages, indent=2)
-        dispatcher_result = await temporal_dispatch_agent.run(stringified_thread, output_type=DispatchResult)  # type: ignore[call-arg]  # pyright: ignore[reportUnknownVariableType]
+        # Pass thread messages as a JSON array string to dispatch agent
+        stringified_thread = "[" + ",".join(self._serialized_messages) + "]"
+        dispatcher_result = await temporal_dispatch_agent.run(stringified_thread)
 
         if isinstance(dispatcher_result.output, NoResponse):
             return
 
-        # remove thinking reaction before posting a message
-        await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
-            slack_reactions_remove,
-            SlackReaction(message=event_message, name="spin"),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
+        if not parallel_activities:
+            # remove thinking reaction before running the agents
+            await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                slack_reactions_remove,
+                SlackReaction(message=event_message, name="spin"),
+                start_to_close_timeout=_slack_activity_timeout,
+            )
 
         response: str | list[dict[str, Any]]
         if isinstance(dispatcher_result.output, SlackResponse):
@@ -152,7 +176,7 @@ class SlackThreadWorkflow:
             request = dispatcher_result.output
             # Default repo used when not specified in thread context
             deps = GitHubDependencies(repo_name="default-repo")
-            result = await temporal_github_agent.run(request.query, output_type=GitHubResponse, deps=deps)  # type: ignore[call-arg, arg-type]
+            result = await temporal_github_agent.run(request.query, deps=deps)
             response = result.output.response
         elif isinstance(dispatcher_result.output, WebResearchRequest):
             # Populate thread context and pass structured request
@@ -161,17 +185,33 @@ class SlackThreadWorkflow:
             else:
                 request = dispatcher_result.output
                 # Pass the query string to the agent
-                result = await temporal_web_research_agent.run(request.query, output_type=WebResearchResponse)
+                result = await temporal_web_research_agent.run(request.query)
                 response = result.output.response
         else:
             assert_never(dispatcher_result.output)  # type: ignore[arg-type]
 
-        # Post response
-        await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
-            slack_chat_post_message,
-            SlackReply(thread=event_message, content=response),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
+        # Content is already-validated agent output, so skip re-validation
+        reply = SlackReply.model_construct(thread=event_message, content=response)
+        if parallel_activities:
+            # Remove thinking reaction and post response concurrently
+            await asyncio.gather(
+                workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                    slack_reactions_remove,
+                    SlackReaction(message=event_message, name="spin"),
+                    start_to_close_timeout=_slack_activity_timeout,
+                ),
+                workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                    slack_chat_post_message,
+                    reply,
+                    start_to_close_timeout=_slack_activity_timeout,
+                ),
+            )
+        else:
+            await workflow.execute_activity(  # pyright: ignore[reportUnknownMemberType]
+                slack_chat_post_message,
+                reply,
+                start_to_close_timeout=_slack_activity_timeout,
+            )
 
 
 @workflow.defn
@@ -223,8 +263,8 @@ class PeriodicGitHubPRCheckWorkflow:
             self._conversation_messages.append(user_message)
 
             # Use dispatcher to determine which agent to use (GitHub, WebResearch, etc.)
-            stringified_conversation = json.dumps(self._conversation_messages, indent=2)
-            dispatcher_result = await temporal_dispatch_agent.run(stringified_conversation, output_type=DispatchResult)  # type: ignore[call-arg]
+            stringified_conversation = to_json(self._conversation_messages, indent=2).decode()
+            dispatcher_result = await temporal_dispatch_agent.run(stringified_conversation)
 
             # Handle dispatcher result
             response: str | list[dict[str, Any]]
@@ -238,7 +278,7 @@ class PeriodicGitHubPRCheckWorkflow:
                 # Route to GitHub agent based on dispatcher decision
                 request = dispatcher_result.output
                 deps = GitHubDependencies(repo_name=self._repo_name)
-                result = await temporal_github_agent.run(request.query, output_type=GitHubResponse, deps=deps)  # type: ignore[call-arg, arg-type]
+                result = await temporal_github_agent.run(request.query, deps=deps)
                 response = result.output.response
                 workflow.logger.info(f"Check #{check_num} - Processed via GitHub agent")
             elif isinstance(dispatcher_result.output, WebResearchRequest):
@@ -248,7 +288,7 @@ class PeriodicGitHubPRCheckWorkflow:
                     workflow.logger.warning(f"Check #{check_num} - Web research requested but not configured")
                 else:
                     request = dispatcher_result.output
-                    result = await temporal_web_research_agent.run(request.query, output_type=WebResearchResponse)
+                    result = await temporal_web_research_agent.run(request.query)
                     response = result.output.response
                     workflow.logger.info(f"Check #{check_num} - Processed via Web Research agent")
             else:
@@ -329,8 +369,8 @@ class CLIConversationWorkflow:
 
         # Get directive from the dispatch agent
         # Pass conversation messages as JSON string to dispatch agent
-        stringified_conversation = json.dumps(self._conversation_messages, indent=2)
-        dispatcher_result = await temporal_dispatch_agent.run(stringified_conversation, output_type=DispatchResult)  # type: ignore[call-arg]
+        stringified_conversation = to_json(self._conversation_messages, indent=2).decode()
+        dispatcher_result = await temporal_dispatch_agent.run(stringified_conversation)
 
         if isinstance(dispatcher_result.output, NoResponse):
             # Store empty response
@@ -345,7 +385,7 @@ class CLIConversationWorkflow:
             request = dispatcher_result.output
             # Use configured repo name from workflow instance
             deps = GitHubDependencies(repo_name=self._repo_name)
-            result = await temporal_github_agent.run(request.query, output_type=GitHubResponse, deps=deps)  # type: ignore[call-arg, arg-type]
+            result = await temporal_github_agent.run(request.query, deps=deps)
             response = result.output.response
         elif isinstance(dispatcher_result.output, WebResearchRequest):
             # Delegate to web research agent
@@ -353,7 +393,7 @@ class CLIConversationWorkflow:
                 response = "Web research is not available. Please configure JINA_API_KEY."
             else:
                 request = dispatcher_result.output
-                result = await temporal_web_research_agent.run(request.query, output_type=WebResearchResponse)
+                result = await temporal_web_research_agent.run(request.query)
                 response = result.output.response
         else:
             assert_never(dispatcher_result.output)  # type: ignore[arg-type]
@@ -366,8 +406,8 @@ class CLIConversationWorkflow:
         }
         self._conversation_messages.append(assistant_message)
 
-        # Set latest response for query
-        self._latest_response = CLIResponse(
+        # Set latest response for query (content is already-validated agent output)
+        self._latest_response = CLIResponse.model_construct(
             content=response,
             metadata={
                 "timestamp": assistant_message["timestamp"],
@@ -1,11 +1,21 @@
 """Tool integrations used by agents (e.g., Jina search)."""
 
 from .jina_search import (
+    JinaMultiSearchResult,
     JinaSearchResult,
     JinaSearchTool,
+    jina_multi_search_tool,
     jina_search_ta,
     jina_search_tool,
 )
 from .pygithub import GitHubConn
 
-__all__ = ["GitHubConn", "JinaSearchResult", "JinaSearchTool", "jina_search_ta", "jina_search_tool"]
+__all__ = [
+    "GitHubConn",
+    "JinaMultiSearchResult",
+    "JinaSearchResult",
+    "JinaSearchTool",
+    "jina_multi_search_tool",
+    "jina_search_ta",
+    "jina_search_tool",
+]
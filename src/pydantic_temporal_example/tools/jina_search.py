@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any, Literal
+from functools import cache
+from typing import Any, Literal, cast
 
 import httpx
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter
 from pydantic_ai.tools import Tool
+from pydantic_core import from_json, to_json
 from typing_extensions import TypedDict
 
 from pydantic_temporal_example.config import get_jina_api_key
@@ -32,37 +34,107 @@ class JinaSearchResult(TypedDict):
     """The relevance score of the search result."""
 
 
+class JinaMultiSearchResult(TypedDict):
+    """The outcome of a single query within a Jina multi-search."""
+
+    query: str
+    """The search query."""
+    results: list[JinaSearchResult]
+    """The search results, empty if the query failed."""
+    error: str | None
+    """The error message if the query failed."""
+
+
 jina_search_ta = TypeAdapter(list[JinaSearchResult])
 
 
-@dataclass
+class _JinaSearchAPIResult(BaseModel):
+    """A search result as returned by the Jina Search API, with defaults for missing fields."""
+
+    title: str = ""
+    url: str = ""
+    content: str = ""
+    score: float = 0.0
+
+
+class _JinaSearchAPIResponse(BaseModel):
+    """The Jina Search API JSON response body."""
+
+    data: list[_JinaSearchAPIResult] = []
+
+
+# Days covered by each `time_range` value, used to build the basic search date filter
+_TIME_RANGE_DAYS: dict[str, int] = {
+    "day": 1,
+    "d": 1,
+    "week": 7,
+    "w": 7,
+    "month": 30,
+    "m": 30,
+    "year": 365,
+    "y": 365,
+}
+
+# Prompt wording for each `time_range` value, used by advanced search
+_TIME_RANGE_DESCRIPTIONS: dict[str, str] = {
+    "day": "from the last day",
+    "d": "from the last day",
+    "week": "from the last week",
+    "w": "from the last week",
+    "month": "from the last month",
+    "m": "from the last month",
+    "year": "from the last year",
+    "y": "from the last year",
+}
+
+# DeepSearch streams server-sent events; the payload follows this field name, optionally after a single space
+_SSE_DATA_PREFIX = "data:"
+
+# Upper bound on concurrent Jina requests issued by a single multi-search
+_MULTI_SEARCH_CONCURRENCY = 4
+
+# Non-empty parsed results are reused for an hour; the least recently used entry is evicted once the cache is full
+_SEARCH_CACHE_TTL_SECONDS = 3600.0
+_SEARCH_CACHE_MAXSIZE = 1024
+
+
+@dataclass(slots=True)
 class JinaSearchTool:
     """The Jina search tool."""
 
     api_key: str
     """The Jina API key."""
+    _cache: dict[tuple[str, str, str | None], tuple[float, list[JinaSearchResult]]] = field(
+        default_factory=dict[tuple[str, str, str | None], tuple[float, list[JinaSearchResult]]],
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Recent non-empty parsed results keyed by (query, search_deep, time_range), with their expiry time."""
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False, compare=False)
+    """HTTP client created on first use and reused so connections to Jina are kept alive between searches."""
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=120.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, if one was created; the next search creates a new one."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     def _build_time_range_filter(self, time_range: str | None) -> str:
         """Build SERP-compatible time filter for basic search."""
         if not time_range:
             return ""
 
-        # Map time_range to date calculations
-        time_map = {
-            "day": 1,
-            "d": 1,
-            "week": 7,
-            "w": 7,
-            "month": 30,
-            "m": 30,
-            "year": 365,
-            "y": 365,
-        }
-
-        days = time_map.get(time_range, 0)
+        days = _TIME_RANGE_DAYS.get(time_range, 0)
         if days:
-            target_date = datetime.now(UTC) - timedelta(days=days)
-            return f" after:{target_date.strftime('%Y-%m-%d')}"
+            target_date = datetime.now(UTC).date() - timedelta(days=days)
+            return f" after:{target_date.isoformat()}"
         return ""
 
     def _append_time_range_to_prompt(self, query: str, time_range: str | None) -> str:
@@ -70,18 +142,7 @@ class JinaSearchTool:
         if not time_range:
             return query
 
-        time_descriptions = {
-            "day": "from the last day",
-            "d": "from the last day",
-            "week": "from the last week",
-            "w": "from the last week",
-            "month": "from the last month",
-            "m": "from the last month",
-            "year": "from the last year",
-            "y": "from the last year",
-        }
-
-        time_desc = time_descriptions.get(time_range, "")
+        time_desc = _TIME_RANGE_DESCRIPTIONS.get(time_range, "")
         if time_desc:
             return f"{query} (Focus on information {time_desc})"
         return query
@@ -101,39 +162,42 @@ class JinaSearchTool:
             "POST",
             "https://deepsearch.jina.ai/v1/chat/completions",
             headers=headers,
-            json={
-                "model": "jina-deepsearch-v1",
-                "messages": [{"role": "user", "content": enhanced_query}],
-                "stream": True,
-            },
+            content=to_json(
+                {
+                    "model": "jina-deepsearch-v1",
+                    "messages": [{"role": "user", "content": enhanced_query}],
+                    "stream": True,
+                },
+            ),
         ) as response:
             response.raise_for_status()
 
-            full_content = ""
+            content_parts: list[str] = []
             async for line in response.aiter_lines():
-                if not line or not line.startswith("data:"):
+                if not line.startswith(_SSE_DATA_PREFIX):
                     continue
                 try:
-                    chunk_str = line[len("data: ") :]
+                    # Any space after the prefix is skipped by `strip` and `from_json`
+                    chunk_str = line[len(_SSE_DATA_PREFIX) :]
                     if chunk_str.strip() == "[DONE]":
                         break
-                    chunk = json.loads(chunk_str)
+                    chunk = from_json(chunk_str)
                     choices = chunk.get("choices", [])
                     if choices:
                         delta = choices[0].get("delta", {})
                         if "content" in delta:
-                            full_content += delta["content"]
+                            content_parts.append(delta["content"])
                         # DeepSearch may stream reasoning content separately
                         if "reasoning_content" in delta:
-                            full_content += delta["reasoning_content"]
-                except (json.JSONDecodeError, IndexError, KeyError):
+                            content_parts.append(delta["reasoning_content"])
+                except (ValueError, IndexError, KeyError):
                     continue  # Ignore invalid JSON lines
 
         return [
             {
                 "title": f"DeepSearch Result for: {query}",
                 "url": "",
-                "content": full_content,
+                "content": "".join(content_parts),
                 "score": 0.0,
             },
         ]
@@ -144,13 +208,17 @@ class JinaSearchTool:
         time_range: str | None,
         client: httpx.AsyncClient,
         headers: dict[str, str],
-    ) -> list[JinaSearchResult]:
-        """Execute basic search using standard Search API."""
+    ) -> tuple[list[JinaSearchResult], bool]:
+        """Execute basic search using standard Search API.
+
+        Returns the results and whether they were parsed from a JSON body (rather than the raw-text fallback).
+        """
         enhanced_query = query + self._build_time_range_filter(time_range)
 
         # Prefer JSON; fall back to text/markdown
         backoff = 1.0
         results: list[JinaSearchResult] = []
+        parsed = False
         max_retries = 2
         http_too_many_requests = 429
 
@@ -163,19 +231,12 @@ class JinaSearchTool:
                 )
                 response.raise_for_status()
                 try:
-                    data = response.json()
-                    raw_results = data.get("data", [])
-                    results = [
-                        {
-                            "title": item.get("title", ""),
-                            "url": item.get("url", ""),
-                            "content": item.get("content", ""),
-                            "score": float(item.get("score", 0.0)),
-                        }
-                        for item in raw_results
-                    ]
+                    # Parse and validate the raw body in one pass, then dump to plain `JinaSearchResult` dicts
+                    data = _JinaSearchAPIResponse.model_validate_json(response.content).model_dump()["data"]
+                    results = cast("list[JinaSearchResult]", data)
+                    parsed = True
                     break
-                except (json.JSONDecodeError, ValueError, KeyError):
+                except ValueError:
                     # Treat full body as a single markdown result
                     results = [
                         {
@@ -194,7 +255,7 @@ class JinaSearchTool:
                     continue
                 raise
 
-        return results
+        return results, parsed
 
     async def __call__(
         self,
@@ -212,20 +273,88 @@ class JinaSearchTool:
         Returns:
             The search results.
         """
+        cache_key = (query, search_deep, time_range)
+        now = time.monotonic()
+        cached = self._cache.pop(cache_key, None)
+        if cached is not None and cached[0] > now:
+            self._cache[cache_key] = cached
+            return cached[1]
+
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            if search_deep == "advanced":
-                results = await self._advanced_search(query, time_range, client, headers)
+        client = self._get_client()
+        if search_deep == "advanced":
+            results = await self._advanced_search(query, time_range, client, headers)
+            # An empty answer means the stream carried no content, so it is not worth keeping
+            cacheable = bool(results[0]["content"])
+        else:
+            results, parsed = await self._basic_search(query, time_range, client, headers)
+            # Raw-text fallbacks and empty result sets are not cached, so the next call retries the search
+            cacheable = parsed and bool(results)
+
+        if cacheable:
+            if len(self._cache) >= _SEARCH_CACHE_MAXSIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[cache_key] = (now + _SEARCH_CACHE_TTL_SECONDS, results)
+        return results
+
+    async def multi_search(
+        self,
+        queries: list[str],
+        search_deep: Literal["basic", "advanced"] = "basic",
+        time_range: Literal["day", "week", "month", "year", "d", "w", "m", "y"] | None = None,
+    ) -> list[JinaMultiSearchResult]:
+        """Searches Jina for several queries concurrently and returns the results per query.
+
+        Args:
+            queries: The search queries to execute with Jina.
+            search_deep: The depth of the search.
+            time_range: The time range back from the current date to filter results.
+
+        Returns:
+            One entry per query, in the same order as `queries`.
+        """
+        semaphore = asyncio.Semaphore(_MULTI_SEARCH_CONCURRENCY)
+
+        async def _search(query: str) -> list[JinaSearchResult]:
+            async with semaphore:
+                return await self(query=query, search_deep=search_deep, time_range=time_range)
+
+        outcomes = await asyncio.gather(*(_search(query) for query in queries), return_exceptions=True)
+
+        multi_results: list[JinaMultiSearchResult] = []
+        for query, outcome in zip(queries, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                multi_results.append({"query": query, "results": [], "error": str(outcome)})
+            elif isinstance(outcome, BaseException):
+                raise outcome
             else:
-                results = await self._basic_search(query, time_range, client, headers)
+                multi_results.append({"query": query, "results": outcome, "error": None})
+        return multi_results
+
+
+# Search tools keyed by API key; a plain dict rather than `@cache` so `close_jina_clients` can reach every instance
+_JINA_SEARCH_TOOLS: dict[str, JinaSearchTool] = {}
 
-        return jina_search_ta.validate_python(results)
 
+def _get_jina_search_tool(api_key: str) -> JinaSearchTool:
+    """Get the search tool shared by every Jina tool using `api_key`, so they share its client and cache."""
+    tool = _JINA_SEARCH_TOOLS.get(api_key)
+    if tool is None:
+        tool = _JINA_SEARCH_TOOLS[api_key] = JinaSearchTool(api_key=api_key)
+    return tool
 
+
+async def close_jina_clients() -> None:
+    """Close the HTTP clients of every shared Jina search tool."""
+    for tool in _JINA_SEARCH_TOOLS.values():
+        await tool.aclose()
+
+
+@cache
 def jina_search_tool(api_key: str) -> Tool[Any]:
     """Creates a Jina search tool.
 
@@ -235,15 +364,34 @@ def jina_search_tool(api_key: str) -> Tool[Any]:
             You can get one by signing up at https://jina.ai
 
     Returns:
-        Tool[Any]: A Tool configured to execute Jina searches.
+        Tool[Any]: A Tool configured to execute Jina searches, cached per API key.
     """
     return Tool[Any](
-        JinaSearchTool(api_key=api_key).__call__,
+        _get_jina_search_tool(api_key).__call__,
         name="jina_search",
         description="Searches Jina for the given query and returns the results.",
     )
 
 
+@cache
+def jina_multi_search_tool(api_key: str) -> Tool[Any]:
+    """Creates a Jina tool that runs several searches concurrently in one tool call.
+
+    Args:
+        api_key: The Jina API key.
+
+            You can get one by signing up at https://jina.ai
+
+    Returns:
+        Tool[Any]: A Tool configured to execute Jina searches in parallel, cached per API key.
+    """
+    return Tool[Any](
+        _get_jina_search_tool(api_key).multi_search,
+        name="jina_multi_search",
+        description="Searches Jina for several queries in parallel and returns the results for each query.",
+    )
+
+
 async def jina_search(
     query: str,
     max_results: int = 5,
@@ -261,6 +409,6 @@ async def jina_search(
     Returns:
         The search results, limited to max_results.
     """
-    tool = JinaSearchTool(api_key=get_jina_api_key())
+    tool = _get_jina_search_tool(get_jina_api_key())
     results = await tool(query=query, search_deep=search_deep, time_range=time_range)
     return results[:max_results]
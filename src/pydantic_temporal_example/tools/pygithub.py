@@ -1,5 +1,6 @@
 """PyGithub wrapper for accessing GitHub repositories and pull requests."""
 
+import time
 from typing import Any
 
 import logfire
@@ -10,6 +11,10 @@ from github.Repository import Repository
 
 from pydantic_temporal_example.config import get_github_org, get_github_pat
 
+# Branch and pull request listings change slowly, so repeated lookups within this window are served from memory
+_LISTING_CACHE_TTL_SECONDS = 45.0
+_LISTING_CACHE_MAXSIZE = 1024
+
 
 class GitHubConn:
     """GitHub connection wrapper for accessing repository information.
@@ -30,11 +35,27 @@ class GitHubConn:
         auth = Auth.Token(get_github_pat())
         self.g = Github(auth=auth)
         self.organization = organization or get_github_org()
+        # Recent listings keyed by (method, repo_name, *args), with their expiry time
+        self._listing_cache: dict[tuple[str, ...], tuple[float, list[dict[str, Any]]]] = {}
 
         if not self.organization or not self.organization.strip():
             msg = "GitHub organization must be set via GITHUB_ORG environment variable or constructor argument"
             raise ValueError(msg)
 
+    def _get_cached_listing(self, key: tuple[str, ...]) -> list[dict[str, Any]] | None:
+        """Return a cached listing if it has not expired, marking it as most recently used."""
+        cached = self._listing_cache.pop(key, None)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        self._listing_cache[key] = cached
+        return cached[1]
+
+    def _store_listing(self, key: tuple[str, ...], listing: list[dict[str, Any]]) -> None:
+        """Cache a listing, evicting the least recently used entry once the cache is full."""
+        if len(self._listing_cache) >= _LISTING_CACHE_MAXSIZE:
+            del self._listing_cache[next(iter(self._listing_cache))]
+        self._listing_cache[key] = (time.monotonic() + _LISTING_CACHE_TTL_SECONDS, listing)
+
     def get_repo(self, repo_name: str) -> Repository:
         """Get a repository by name.
 
@@ -160,15 +181,20 @@ class GitHubConn:
         Returns:
             List of branch dictionaries with name and sha
         """
+        cache_key = ("branches", repo_name)
+        if (cached := self._get_cached_listing(cache_key)) is not None:
+            return cached
         try:
             repo = self.get_repo(repo_name)
-            return [
+            branches = [
                 {"name": branch.name, "sha": branch.commit.sha, "protected": branch.protected}
                 for branch in repo.get_branches()
             ]
         except Exception as e:
             logfire.error("Error getting branches from repository", repo_name=repo_name, error=str(e))
             raise
+        self._store_listing(cache_key, branches)
+        return branches
 
     def list_pull_requests(self, repo_name: str, state: str = "all") -> list[dict[str, Any]]:
         """List all pull requests in a repository.
@@ -180,9 +206,12 @@ class GitHubConn:
         Returns:
             List of PR dictionaries with number, title, state, and author
         """
+        cache_key = ("pull_requests", repo_name, state)
+        if (cached := self._get_cached_listing(cache_key)) is not None:
+            return cached
         try:
             repo = self.get_repo(repo_name)
-            return [
+            pull_requests = [
                 {
                     "number": pr.number,
                     "title": pr.title,
@@ -196,3 +225,5 @@ class GitHubConn:
         except Exception as e:
             logfire.error("Error listing pull requests from repository", repo_name=repo_name, error=str(e))
             raise
+        self._store_listing(cache_key, pull_requests)
+        return pull_requests
@@ -2,26 +2,58 @@
 
 from __future__ import annotations
 
-import hashlib
+import binascii
 import hmac
 import time
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import Any
 
 from fastapi import HTTPException
+from pydantic import ValidationError
+from pydantic_core import from_json
+from starlette.requests import Request  # FastAPI resolves this annotation at runtime
 
 from pydantic_temporal_example.config import get_settings
-from pydantic_temporal_example.models import SlackEventsAPIBody, SlackEventsAPIBodyAdapter, URLVerificationEvent
+from pydantic_temporal_example.models import (
+    SlackEventsAPIBody,
+    URLVerificationEvent,
+    validate_slack_events_body_json,
+)
 
-if TYPE_CHECKING:
-    from starlette.requests import Request
+
+class UnknownSlackPayloadError(Exception):
+    """Raised for a verified Slack payload that does not match any supported event model."""
+
+    def __init__(self, payload: Any) -> None:
+        """Store the raw decoded payload for logging.
+
+        Args:
+            payload: The JSON-decoded request body
+        """
+        super().__init__("Unhandled Slack event")
+        self.payload = payload
+
+
+@cache
+def _signing_secret_bytes() -> bytes:
+    """Return the Slack signing secret encoded for HMAC, or empty bytes if it is not configured.
+
+    Cached like the settings it is read from, so the secret is unwrapped and encoded once per process.
+    """
+    signing_secret = get_settings().slack_signing_secret
+    return signing_secret.get_secret_value().encode("utf-8") if signing_secret else b""
 
 
 async def get_verified_slack_events_body(
     request: Request,
-) -> SlackEventsAPIBody | URLVerificationEvent | dict[str, Any]:
-    """Verify Slack request signature and timestamp, then parse the events payload."""
-    settings = get_settings()
-    signing_secret = settings.slack_signing_secret.get_secret_value()
+) -> SlackEventsAPIBody | URLVerificationEvent:
+    """Verify Slack request signature and timestamp, then parse the events payload.
+
+    Raises:
+        HTTPException: If the request is not a correctly signed Slack request or its body is not JSON
+        UnknownSlackPayloadError: If the payload is valid JSON but not a supported Slack event
+    """
+    signing_secret = _signing_secret_bytes()
     if not signing_secret:
         raise HTTPException(status_code=401, detail="Slack signing secret not configured")
 
@@ -46,18 +78,22 @@ async def get_verified_slack_events_body(
 
     # Get request body
     request_body = await request.body()
-    request_body_str = request_body.decode("utf-8")
 
-    # Create the base string for the signature
-    base_string = f"v0:{timestamp_header}:{request_body_str}"
+    # Create the base string for the signature from the raw body bytes (no decode/re-encode round-trip)
+    base_string = b"v0:" + timestamp_header.encode("utf-8") + b":" + request_body
 
-    # Calculate expected signature
-    expected_signature = (
-        "v0=" + hmac.new(signing_secret.encode("utf-8"), base_string.encode("utf-8"), hashlib.sha256).hexdigest()
-    )
+    # Calculate expected signature with the one-shot C HMAC routine
+    expected_signature = b"v0=" + binascii.hexlify(hmac.digest(signing_secret, base_string, "sha256"))
 
     # Compare signatures
-    if not hmac.compare_digest(expected_signature, signature_header):
+    if not hmac.compare_digest(expected_signature, signature_header.encode("utf-8")):
         raise HTTPException(status_code=401, detail="Invalid request signature")
 
-    return SlackEventsAPIBodyAdapter.validate_json(request_body_str)
+    try:
+        return validate_slack_events_body_json(request_body)
+    except ValidationError as e:
+        try:
+            payload = from_json(request_body)
+        except ValueError as json_error:
+            raise HTTPException(status_code=400, detail="Invalid JSON body") from json_error
+        raise UnknownSlackPayloadError(payload) from e
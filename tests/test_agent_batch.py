@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from pydantic_temporal_example.agents.batch import run_batch_async
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async_preserves_order_and_bounds_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def echo(messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        prompt = messages[-1].parts[-1].content  # type: ignore[union-attr]
+        return ModelResponse(parts=[TextPart(content=f"echo {prompt}")])
+
+    agent = Agent(FunctionModel(echo))
+    results = await run_batch_async(agent, [f"p{i}" for i in range(6)], concurrency=2)
+    assert [r.output for r in results] == [f"echo p{i}" for i in range(6)]
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async_rejects_non_positive_concurrency():
+    with pytest.raises(ValueError):
+        await run_batch_async(Agent(FunctionModel(lambda *_: ModelResponse(parts=[]))), ["p"], concurrency=0)
@@ -1,6 +1,9 @@
 import pytest
 import pydantic_temporal_example.api as api_mod
+from temporalio.exceptions import TemporalError
+from temporalio.service import RPCError, RPCStatusCode
 from pydantic_temporal_example.models import URLVerificationEvent, AppMentionEvent, MessageChannelsEvent
+from fastapi import BackgroundTasks
 from starlette.responses import JSONResponse, Response
 
 
@@ -28,11 +31,35 @@ async def test_handle_app_mention_event_starts_workflow(monkeypatch):
     event = AppMentionEvent(
         type="app_mention", user="U", text="hi", ts="1.1", channel="C", event_ts="1.1", thread_ts=None
     )
-    resp: Response = await api_mod.handle_app_mention_event(event, FakeTemporalClient())  # type: ignore[arg-type]
+    tasks = BackgroundTasks()
+    resp: Response = await api_mod.handle_app_mention_event(event, FakeTemporalClient(), tasks)  # type: ignore[arg-type]
     assert resp.status_code == 204
+    assert not started  # workflow start is deferred until after the response
+    await tasks()
     assert "id" in started["kwargs"] and "task_queue" in started["kwargs"]
 
 
+@pytest.mark.asyncio
+async def test_background_workflow_start_failure_is_logged(monkeypatch):
+    class DummySettings:
+        temporal_task_queue = "q"
+    monkeypatch.setattr(api_mod, "get_settings", lambda: DummySettings(), raising=True)
+    monkeypatch.setattr(api_mod, "TemporalError", TemporalError, raising=True)
+    logged = []
+    monkeypatch.setattr(api_mod.logfire, "exception", lambda msg, **kw: logged.append((msg, kw)), raising=True)
+
+    class FakeTemporalClient:
+        async def start_workflow(self, *args, **kwargs):
+            raise RPCError("temporal down", RPCStatusCode.UNAVAILABLE, b"")
+    event = AppMentionEvent(
+        type="app_mention", user="U", text="hi", ts="1.1", channel="C", event_ts="1.1", thread_ts=None
+    )
+    tasks = BackgroundTasks()
+    await api_mod.handle_app_mention_event(event, FakeTemporalClient(), tasks)  # type: ignore[arg-type]
+    await tasks()  # must not raise
+    assert logged and logged[0][1]["workflow_id"] == "app-mention-1-1"
+
+
 @pytest.mark.asyncio
 async def test_handle_message_channels_event_when_no_workflow():
     # Avoid importing real TemporalError by overriding the symbol used in the module.
@@ -42,13 +69,41 @@ async def test_handle_message_channels_event_when_no_workflow():
     api_mod.TemporalError = DummyTemporalError  # type: ignore[attr-defined]
 
     class FakeHandle:
-        async def describe(self):
+        async def signal(self, *args, **kwargs):
             raise DummyTemporalError()
-        async def signal(self, *args, **kwargs): ...
     class FakeTemporalClient:
         def get_workflow_handle_for(self, *_args, **_kwargs): return FakeHandle()
     event = MessageChannelsEvent(
         type="message", user="U", text="yo", ts="1.1", channel="C", event_ts="1.1", channel_type="channel", thread_ts=None
     )
-    resp: Response = await api_mod.handle_message_channels_event(event, FakeTemporalClient())  # type: ignore[arg-type]
-    assert resp.status_code == 204
\ No newline at end of file
+    tasks = BackgroundTasks()
+    resp: Response = await api_mod.handle_message_channels_event(event, FakeTemporalClient(), tasks)  # type: ignore[arg-type]
+    assert resp.status_code == 204
+    await tasks()
+
+
+@pytest.mark.asyncio
+async def test_background_signal_failure_is_logged(monkeypatch):
+    monkeypatch.setattr(api_mod, "TemporalError", TemporalError, raising=True)
+    logged = []
+    monkeypatch.setattr(api_mod.logfire, "exception", lambda msg, **kw: logged.append((msg, kw)), raising=True)
+
+    class FakeHandle:
+        async def signal(self, *args, **kwargs):
+            raise RPCError("temporal down", RPCStatusCode.UNAVAILABLE, b"")
+    class FakeTemporalClient:
+        def get_workflow_handle_for(self, *_args, **_kwargs): return FakeHandle()
+    event = MessageChannelsEvent(
+        type="message", user="U", text="yo", ts="1.1", channel="C", event_ts="1.1", channel_type="channel", thread_ts=None
+    )
+    tasks = BackgroundTasks()
+    await api_mod.handle_message_channels_event(event, FakeTemporalClient(), tasks)  # type: ignore[arg-type]
+    await tasks()  # must not raise
+    assert logged and logged[0][1]["workflow_id"] == "app-mention-1-1"
+
+@pytest.mark.asyncio
+async def test_handle_unknown_slack_payload_acknowledges():
+    from pydantic_temporal_example.tools.slack import UnknownSlackPayloadError
+
+    resp: Response = await api_mod.handle_unknown_slack_payload(None, UnknownSlackPayloadError({"type": "x"}))  # type: ignore[arg-type]
+    assert resp.status_code == 204
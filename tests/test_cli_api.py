@@ -39,6 +39,7 @@ class TestCLIWorkflowAPI:
             assert "workflow_id" in data
             assert data["message"] == "Workflow assigned to a worker."
             assert data["is_repeating"] is False
+            assert data["periodic_workflow_id"] is None
 
     def test_submit_cli_workflow_with_repeat(self):
         """Test CLI workflow submission with repeat enabled."""
@@ -65,6 +66,7 @@ class TestCLIWorkflowAPI:
             assert "Repeating mode enabled" in data["message"]
             # Should have two workflow IDs (main + periodic)
             assert "," in data["workflow_id"]
+            assert data["workflow_id"].endswith(f",{data['periodic_workflow_id']}")
 
     def test_submit_cli_workflow_invalid_data(self):
         """Test CLI workflow submission with invalid data."""
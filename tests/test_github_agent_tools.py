@@ -0,0 +1,28 @@
+import pytest
+from types import SimpleNamespace
+
+import pydantic_temporal_example.agents.github_agent as ga
+
+
+class FakeConn:
+    def get_pull_request(self, repo_name, pr_number):
+        return SimpleNamespace(
+            number=pr_number, title="Add feature", state="open", user=SimpleNamespace(login="alice"),
+            created_at="2025-01-01", body=None, changed_files=2, additions=10, deletions=3,
+        )
+    def get_pr_comments(self, repo_name, pr_number):
+        return [{"user": "bob", "body": "LGTM", "created_at": "2025-01-02", "path": "a.py", "type": "review_comment"}]
+
+
+@pytest.mark.asyncio
+async def test_view_pr_bundle_combines_details_and_comments(monkeypatch):
+    monkeypatch.setattr(ga, "_get_github_conn", lambda: FakeConn(), raising=True)
+    out = await ga.view_pr_bundle(None, "repo", 7)
+    details, comments = out.split("\n\n", 1)
+    assert details == await ga.view_pull_request(None, "repo", 7)
+    assert comments == await ga.view_pr_comments(None, "repo", 7)
+    assert "Pull Request #7: Add feature" in details and "File: a.py" in comments
+
+
+def test_github_agent_registers_pr_bundle_tool():
+    assert "view_pr_bundle" in ga.get_github_agent()._function_toolset.tools
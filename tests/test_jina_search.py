@@ -1,5 +1,8 @@
+import json
+
 import pytest
 import httpx
+import pydantic_temporal_example.tools.jina_search as jina_search_module
 from pydantic_temporal_example.tools.jina_search import JinaSearchTool, jina_search
 
 
@@ -15,10 +18,8 @@ def test_time_range_helpers():
 async def test_basic_json_response(monkeypatch):
     class FakeResponse:
         def __init__(self, data):
-            self._data = data
+            self.content = json.dumps(data).encode()
             self.text = ""
-        def json(self):
-            return self._data
         def raise_for_status(self):  # no-op
             return None
     class FakeAsyncClient:
@@ -27,23 +28,21 @@ async def test_basic_json_response(monkeypatch):
         async def __aexit__(self, exc_type, exc, tb): return False
         async def get(self, url, headers=None, params=None):
             assert "s.jina.ai" in url
-            return FakeResponse({"data": [{"title": "t", "url": "u", "content": "c", "score": 0.9}]})
+            return FakeResponse({"data": [{"title": "t", "url": "u", "content": "c", "score": 0.9}, {"url": "u2"}]})
     monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient, raising=True)
 
     tool = JinaSearchTool(api_key="k")
     res = await tool("query")
     assert res and res[0]["title"] == "t"
+    assert res[1] == {"title": "", "url": "u2", "content": "", "score": 0.0}
 
 
 @pytest.mark.asyncio
 async def test_basic_text_fallback(monkeypatch):
     class FakeResponse:
-        _ERROR_MSG = "not json"
-
         def __init__(self, text):
             self._text = text
-        def json(self):
-            raise ValueError(self._ERROR_MSG)
+            self.content = text.encode()
         @property
         def text(self):
             return self._text
@@ -68,4 +67,126 @@ async def test_jina_search_wrapper_truncates(monkeypatch):
         return [{"title": str(i), "url": "", "content": "", "score": 0.0} for i in range(10)]
     monkeypatch.setattr(JinaSearchTool, "__call__", fake_call, raising=True)
     out = await jina_search("q", max_results=5)
-    assert len(out) == 5
\ No newline at end of file
+    assert len(out) == 5
+
+@pytest.mark.asyncio
+async def test_jina_multi_search_keeps_order_and_isolates_failures(monkeypatch):
+    async def fake_call(self, query, search_deep="basic", time_range=None):
+        if query == "bad":
+            raise httpx.HTTPError("boom")
+        return [{"title": query, "url": "", "content": "", "score": 0.0}]
+    monkeypatch.setattr(JinaSearchTool, "__call__", fake_call, raising=True)
+    out = await JinaSearchTool(api_key="k").multi_search(["a", "bad", "c"])
+    assert [r["query"] for r in out] == ["a", "bad", "c"]
+    assert out[0]["results"][0]["title"] == "a" and out[0]["error"] is None
+    assert out[1]["results"] == [] and out[1]["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache(monkeypatch):
+    calls = []
+    class FakeResponse:
+        text = ""
+        content = b'{"data": [{"title": "t", "url": "u", "content": "c", "score": 0.9}]}'
+        def raise_for_status(self):
+            return None
+    class FakeAsyncClient:
+        def __init__(self, *a, **kw): ...
+        async def __aenter__(self): return self
+        async def __aexit__(self, exc_type, exc, tb): return False
+        async def get(self, url, headers=None, params=None):
+            calls.append(params)
+            return FakeResponse()
+    monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient, raising=True)
+
+    tool = JinaSearchTool(api_key="k")
+    first = await tool("query")
+    second = await tool("query")
+    await tool("query", time_range="d")
+    assert first == second
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_text_fallback_and_empty_results_are_not_cached(monkeypatch):
+    calls = []
+    bodies = {"text": b"plain text body", "empty": b'{"data": []}'}
+    class FakeResponse:
+        def __init__(self, content):
+            self.content = content
+            self.text = content.decode()
+        def raise_for_status(self):
+            return None
+    class FakeAsyncClient:
+        def __init__(self, *a, **kw): ...
+        async def get(self, url, headers=None, params=None):
+            calls.append(params)
+            return FakeResponse(bodies[params["q"]])
+    monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient, raising=True)
+
+    tool = JinaSearchTool(api_key="k")
+    for query in ("text", "text", "empty", "empty"):
+        await tool(query)
+    assert len(calls) == 4
+    assert tool._cache == {}
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_reused_across_searches(monkeypatch):
+    created = []
+    class FakeResponse:
+        text = ""
+        content = b'{"data": []}'
+        def raise_for_status(self):
+            return None
+    class FakeAsyncClient:
+        def __init__(self, *a, **kw):
+            created.append(self)
+        async def get(self, url, headers=None, params=None):
+            return FakeResponse()
+    monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient, raising=True)
+
+    tool = JinaSearchTool(api_key="k")
+    await tool("first")
+    await tool("second")
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_advanced_search_parses_sse_stream(monkeypatch):
+    lines = [
+        'data: {"choices": [{"delta": {"content": "Hello "}}]}',
+        "",
+        "data: not json",
+        'data:{"choices": [{"delta": {"content": "world"}}]}',
+        "data: [DONE]",
+        'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+    ]
+    class FakeStreamResponse:
+        async def __aenter__(self): return self
+        async def __aexit__(self, exc_type, exc, tb): return False
+        def raise_for_status(self):
+            return None
+        async def aiter_lines(self):
+            for line in lines:
+                yield line
+    class FakeAsyncClient:
+        def __init__(self, *a, **kw): ...
+        def stream(self, method, url, headers=None, content=None):
+            assert "deepsearch.jina.ai" in url
+            assert headers["Content-Type"] == "application/json"
+            assert json.loads(content)["messages"][0]["content"] == "query"
+            return FakeStreamResponse()
+    monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient, raising=True)
+
+    res = await JinaSearchTool(api_key="k")("query", search_deep="advanced")
+    assert res[0]["content"] == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_close_jina_clients_closes_shared_client():
+    tool = jina_search_module._get_jina_search_tool("close-test-key")
+    client = tool._get_client()
+    await jina_search_module.close_jina_clients()
+    assert client.is_closed
+    assert tool._client is None
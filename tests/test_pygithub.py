@@ -51,4 +51,18 @@ def test_get_pr_and_comments(monkeypatch):
     monkeypatch.setattr(GitHubConn, "get_repo", lambda _self, _repo_name: Repo(), raising=True)
     out = GitHubConn().get_pr_comments("r", 1)
     kinds = {c["type"] for c in out}
-    assert "issue_comment" in kinds and "review_comment" in kinds
\ No newline at end of file
+    assert "issue_comment" in kinds and "review_comment" in kinds
+
+def test_branch_listing_is_cached(monkeypatch):
+    calls = []
+    class FakeBranch:
+        name, commit, protected = "main", SimpleNamespace(sha="abcdef1"), False
+    class FakeRepo:
+        def get_branches(self):
+            calls.append(1)
+            return [FakeBranch()]
+    monkeypatch.setattr(GitHubConn, "get_repo", lambda _self, _repo_name: FakeRepo(), raising=True)
+    c = GitHubConn(organization="o")
+    assert c.get_branches("repo") == c.get_branches("repo")
+    c.get_branches("other")
+    assert len(calls) == 2
@@ -21,6 +21,14 @@ class FakeRequest:
         return self._body
 
 
+@pytest.fixture(autouse=True)
+def clear_signing_secret_cache():
+    # The encoded secret is cached per process; each test patches its own settings
+    slack_mod._signing_secret_bytes.cache_clear()
+    yield
+    slack_mod._signing_secret_bytes.cache_clear()
+
+
 def _signed_headers(secret: str, body: dict) -> tuple[dict, bytes]:
     ts = str(int(time.time()))
     raw = json.dumps(body).encode()
@@ -58,4 +66,16 @@ async def test_get_verified_slack_events_body_invalid_signature(monkeypatch):
         json.dumps(payload).encode(),
     )
     with pytest.raises(Exception):
-        await slack_mod.get_verified_slack_events_body(req)  # type: ignore[arg-type]
\ No newline at end of file
+        await slack_mod.get_verified_slack_events_body(req)  # type: ignore[arg-type]
+
+@pytest.mark.asyncio
+async def test_get_verified_slack_events_body_unknown_payload(monkeypatch):
+    class DummySettings:
+        slack_signing_secret = DummySecret("supersecret")
+    monkeypatch.setattr(slack_mod, "get_settings", lambda: DummySettings(), raising=True)
+
+    payload = {"type": "app_rate_limited", "token": "t", "minute_rate_limited": 1}
+    headers, raw = _signed_headers("supersecret", payload)
+    with pytest.raises(slack_mod.UnknownSlackPayloadError) as exc_info:
+        await slack_mod.get_verified_slack_events_body(FakeRequest(headers, raw))  # type: ignore[arg-type]
+    assert exc_info.value.payload == payload
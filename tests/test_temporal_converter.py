@@ -0,0 +1,23 @@
+from pydantic_temporal_example.models import AppMentionEvent, SlackMessageID, SlackReply
+from pydantic_temporal_example.temporal.converter import TRUSTED_MODELS, trusted_pydantic_data_converter
+
+
+def test_trusted_model_roundtrip_skips_validation():
+    assert AppMentionEvent in TRUSTED_MODELS
+    converter = trusted_pydantic_data_converter.payload_converter
+    event = AppMentionEvent(type="app_mention", user="U", text="hi", ts="1.1", channel="C", event_ts="1.1")
+    [decoded] = converter.from_payloads(converter.to_payloads([event]), [AppMentionEvent])
+    assert decoded == event
+
+    # A payload that would fail validation is still constructed as-is, proving validation was skipped
+    raw = event.model_dump() | {"user": 123}
+    [decoded] = converter.from_payloads(converter.to_payloads([raw]), [AppMentionEvent])
+    assert decoded.user == 123
+
+
+def test_untrusted_nested_model_roundtrip_is_validated():
+    converter = trusted_pydantic_data_converter.payload_converter
+    reply = SlackReply(thread=SlackMessageID(channel="C", ts="1.1"), content="hello")
+    [decoded] = converter.from_payloads(converter.to_payloads([reply]), [SlackReply])
+    assert isinstance(decoded.thread, SlackMessageID)
+    assert decoded == reply
@@ -43,4 +43,25 @@ async def test_post_delete_and_reactions(monkeypatch):
     out = await sa.slack_reactions_add(SlackReaction(message=thread, name="thumbsup"))
     assert out["ok"]
     out = await sa.slack_reactions_remove(SlackReaction(message=thread, name="thumbsup"))
-    assert out["ok"]
\ No newline at end of file
+    assert out["ok"]
+
+@pytest.mark.asyncio
+async def test_slack_thread_messages_are_projected(monkeypatch):
+    class ProjectingSlack:
+        async def conversations_replies(self, *, channel, ts, oldest=None, cursor=None):
+            blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "*Summary*"}}]
+            return {
+                "messages": [
+                    {"ts": "1.1", "user": "U1", "text": "question", "team": "T1", "reactions": [{"name": "eyes"}]},
+                    {"ts": "1.2", "bot_id": "B1", "blocks": blocks, "bot_profile": {"name": "bot"}},
+                ],
+                "has_more": False,
+            }
+
+    monkeypatch.setattr(sa, "_get_slack_client", lambda: ProjectingSlack(), raising=True)
+    req = SlackConversationsRepliesRequest(channel="C", ts="1.1", oldest=None)
+    msgs = await sa.slack_conversations_replies(req)
+    assert msgs == [
+        {"ts": "1.1", "user": "U1", "text": "question"},
+        {"ts": "1.2", "bot_id": "B1", "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "*Summary*"}}]},
+    ]